@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/3.2/ref/settings/
 """
 import os
+import sys
 from pathlib import Path
 from datetime import timedelta
 from dotenv import load_dotenv
@@ -138,6 +139,45 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing
+# https://docs.djangoproject.com/en/3.2/topics/testing/overview/#password-hashing
+
+# The default PBKDF2 hasher is deliberately slow; the test suite creates
+# many users, so use a fast hasher when running tests
+TESTING = len(sys.argv) > 1 and sys.argv[1] == 'test'
+if TESTING:
+    PASSWORD_HASHERS = [
+        'django.contrib.auth.hashers.MD5PasswordHasher',
+    ]
+
+
+# Caching
+# https://docs.djangoproject.com/en/3.2/topics/cache/
+
+# Cached dashboard data would leak from one test into the next, so tests
+# run without a cache unless they opt in with override_settings
+if TESTING:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+        }
+    }
+
+
+# Test database
+# https://docs.djangoproject.com/en/3.2/topics/testing/overview/#the-test-database
+
+# Set TEST_DB_ENGINE=sqlite to run the suite against an in-memory SQLite
+# database instead of MySQL, which skips the network round trip on every
+# query. CI keeps testing against MySQL.
+if TESTING and os.environ.get('TEST_DB_ENGINE') == 'sqlite':
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': ':memory:',
+        }
+    }
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/3.2/topics/i18n/
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_auto_20260614_2257'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='loginactivity',
+            index=models.Index(fields=['user', '-timestamp'], name='loginactivity_user_ts_idx'),
+        ),
+    ]
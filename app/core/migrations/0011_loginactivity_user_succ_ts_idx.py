@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_loginactivity_user_ts_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='loginactivity',
+            index=models.Index(fields=['user', 'success', '-timestamp'], name='loginactivity_user_succ_ts_idx'),
+        ),
+    ]
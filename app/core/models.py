@@ -71,6 +71,8 @@ class User(AbstractBaseUser, PermissionsMixin):
         max_length=100, blank=True, null=True)
     password_reset_token_created_at = models.DateTimeField(
         null=True, blank=True)
+    # Changes whenever the user is saved, e.g. on a role change
+    updated_at = models.DateTimeField(auto_now=True)
 
     objects = UserManager()
 
@@ -162,6 +164,20 @@ class LoginActivity(models.Model):
         ordering = ['-timestamp']
         verbose_name = 'Login Activity'
         verbose_name_plural = 'Login Activities'
+        indexes = [
+            # Dashboard queries filter by user and a timestamp range, then
+            # order newest first
+            models.Index(
+                fields=['user', '-timestamp'],
+                name='loginactivity_user_ts_idx'
+            ),
+            # Stats and charts also filter on success, e.g. the successful
+            # logins in a range and the latest of them
+            models.Index(
+                fields=['user', 'success', '-timestamp'],
+                name='loginactivity_user_succ_ts_idx'
+            ),
+        ]
 
     def __str__(self):
         return f"LoginActivity for {self.user.username} at {self.timestamp}"
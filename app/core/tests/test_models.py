@@ -1,3 +1,4 @@
+from django.db import connection
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from core.models import LoginActivity
@@ -202,6 +203,26 @@ class LoginActivityModelTests(TestCase):
                 success=True
             )
 
+    def test_login_activity_has_user_timestamp_indexes(self):
+        """Test that login activities are indexed by user and timestamp,
+        with and without success"""
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor, LoginActivity._meta.db_table
+            )
+
+        cases = (
+            ('loginactivity_user_ts_idx', ['user_id', 'timestamp']),
+            ('loginactivity_user_succ_ts_idx',
+             ['user_id', 'success', 'timestamp']),
+        )
+        for name, columns in cases:
+            with self.subTest(index=name):
+                index = constraints.get(name)
+                self.assertIsNotNone(index)
+                self.assertTrue(index['index'])
+                self.assertEqual(index['columns'], columns)
+
 
 class UserStatisticsTests(TestCase):
     """Test user statistics functionality"""
@@ -1,4 +1,5 @@
 """Shared mixins and utility functions for dashboard and report views."""
+import re
 from datetime import datetime
 from django.utils import timezone
 from django.db.models import Q
@@ -6,6 +7,24 @@ from rest_framework import status
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 
+# Dates are accepted only as YYYY-MM-DD
+_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
+def _parse_date(value):
+    """Parse a YYYY-MM-DD string into an aware datetime at UTC midnight.
+
+    The pattern check rejects the other ISO 8601 forms fromisoformat
+    accepts, so it only has to validate the day itself.
+
+    Raises:
+        ValueError: If the value is not a valid YYYY-MM-DD date
+    """
+    if not _DATE_RE.fullmatch(value):
+        raise ValueError(f'Invalid date: {value!r}')
+    return timezone.make_aware(
+        datetime.fromisoformat(value), timezone=timezone.utc)
+
 
 class DateFilterMixin:
     """Mixin providing date filtering functionality for API views."""
@@ -22,13 +41,9 @@ class DateFilterMixin:
         if start_date or end_date:
             try:
                 if start_date:
-                    start_date = timezone.make_aware(
-                        datetime.strptime(start_date, '%Y-%m-%d'),
-                        timezone=timezone.utc)
+                    start_date = _parse_date(start_date)
                 if end_date:
-                    end_date = timezone.make_aware(
-                        datetime.strptime(end_date, '%Y-%m-%d'),
-                        timezone=timezone.utc)
+                    end_date = _parse_date(end_date)
                     # Make end_date inclusive of the full day
                     end_date = end_date.replace(
                         hour=23, minute=59, second=59, microsecond=999999
@@ -1,3 +1,4 @@
+from django.core.paginator import Page, Paginator
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 from collections import OrderedDict
@@ -44,6 +45,15 @@ class SafePageNumberPagination(PageNumberPagination):
         except (TypeError, ValueError):
             page_number = 1
 
+        if page_number == 1:
+            # Fetch the first page directly. When it is not full it holds
+            # every row, so the total is known without a COUNT query.
+            rows = list(queryset[:page_size])
+            if len(rows) < page_size:
+                paginator.count = len(rows)
+            self.page = Page(rows, 1, paginator)
+            return rows
+
         try:
             self.page = paginator.page(page_number)
             return list(self.page)
@@ -83,8 +93,34 @@ class SafePageNumberPagination(PageNumberPagination):
             ]))
 
 
+class DeferredJoinPaginator(Paginator):
+    """
+    Paginator that looks up a page's primary keys before its rows.
+
+    The OFFSET scan then only walks the (user, -timestamp) index, and just
+    the rows on the page are read in full, so deep pages stay cheap.
+    """
+
+    def page(self, number):
+        """Return the page, fetching its rows by primary key."""
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+        pks = list(
+            self.object_list.values_list('pk', flat=True)[bottom:top]
+        )
+        rows_by_pk = self.object_list.in_bulk(pks)
+        # Rows deleted between the two queries are left off the page
+        return self._get_page(
+            [rows_by_pk[pk] for pk in pks if pk in rows_by_pk], number, self
+        )
+
+
 class LoginActivityPagination(SafePageNumberPagination):
     """Custom pagination class for login activity listings."""
+    django_paginator_class = DeferredJoinPaginator
     page_size = 100  # Default page size for login activity
     page_size_query_param = 'size'
     max_page_size = 100
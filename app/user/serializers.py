@@ -17,6 +17,7 @@ from .rsa_key_manager import (
     decrypt_data,
 )
 import binascii
+import hmac
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -66,32 +67,42 @@ class UserSerializer(serializers.ModelSerializer):
         """Return whether the user is an admin (staff or superuser)."""
         return obj.is_staff or obj.is_superuser
 
+    def validate_passwordRepeat(self, value):
+        """
+        Validate that passwordRepeat matches the submitted password.
+
+        Runs as a field validator so a mismatch fails fast, without
+        waiting for the object-level validate() pass, and is reported
+        together with any other field errors. The password is coerced the
+        way its own field coerces it, then compared in constant time.
+        """
+        try:
+            password = self.fields['password'].to_internal_value(
+                self.initial_data.get('password')
+            )
+        except serializers.ValidationError:
+            # A missing or malformed password reports its own error
+            return value
+        if password and not hmac.compare_digest(
+            value.encode(), password.encode()
+        ):
+            raise serializers.ValidationError("password_mismatch")
+        return value
+
     def validate(self, attrs):
         """
-        Validate that the password and passwordRepeat fields match.
+        Validate that passwordRepeat is provided alongside the password.
         """
         password = attrs.get('password')
         password_repeat = attrs.get('passwordRepeat')
 
-        # On creation, both password and passwordRepeat are required
-        if not self.instance:
-            if not password_repeat:
-                raise serializers.ValidationError(
-                    {"passwordRepeat": "password_repeat_null"}
-                )
-            if password != password_repeat:
-                msg = {"passwordRepeat": "password_mismatch"}
-                raise serializers.ValidationError(msg)
+        # On creation, both password and passwordRepeat are required.
         # On update, if password is provided, passwordRepeat must also be
-        # provided
-        elif password:
-            if not password_repeat:
-                raise serializers.ValidationError(
-                    {"passwordRepeat": "password_repeat_null"}
-                )
-            if password != password_repeat:
-                msg = {"passwordRepeat": "password_mismatch"}
-                raise serializers.ValidationError(msg)
+        # provided.
+        if (not self.instance or password) and not password_repeat:
+            raise serializers.ValidationError(
+                {"passwordRepeat": "password_repeat_null"}
+            )
         return attrs
 
     def create(self, validated_data):
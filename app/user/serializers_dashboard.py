@@ -7,10 +7,54 @@ from core.models import LoginActivity, User
 from datetime import timedelta
 from django.utils import timezone
 from collections import defaultdict
-from django.db.models import Count, Q
+from django.db.models import Count, Max, Q
 from django.db.models.functions import TruncDate, TruncWeek, TruncMonth
 
 
+def _format_day(value):
+    """Format a date/datetime as YYYY-MM-DD without going through strftime."""
+    return f'{value.year:04d}-{value.month:02d}-{value.day:02d}'
+
+
+def _format_month(value):
+    """Format a date/datetime as YYYY-MM without going through strftime."""
+    return f'{value.year:04d}-{value.month:02d}'
+
+
+def _base_activity_qs(start_date, end_date, user=None, users=None):
+    """
+    Return LoginActivity rows within the date range.
+
+    Args:
+        start_date: Start of the timestamp range (inclusive)
+        end_date: End of the timestamp range (inclusive)
+        user: Optional single user (or user primary key) to filter by
+        users: Optional iterable/QuerySet of users to filter by
+    """
+    queryset = LoginActivity.objects.filter(
+        timestamp__range=(start_date, end_date)
+    )
+    if user is not None:
+        queryset = queryset.filter(user=user)
+    if users is not None:
+        queryset = queryset.filter(user__in=users)
+    return queryset
+
+
+def _success_failure_counts(activities):
+    """
+    Count successful and failed logins in a single aggregate query.
+
+    Returns:
+        Tuple of (success_count, failure_count)
+    """
+    counts = activities.aggregate(
+        successful=Count('id', filter=Q(success=True)),
+        failed=Count('id', filter=Q(success=False))
+    )
+    return counts['successful'], counts['failed']
+
+
 class LoginActivitySerializer(serializers.ModelSerializer):
     """Serializer for login activity data."""
 
@@ -151,35 +195,42 @@ def get_user_stats(user, start_date=None, end_date=None):
         successful_activities = activities.filter(success=True)
 
         # Calculate successful and failed login counts
-        total_successful_logins = successful_activities.count()
-        total_failed_logins = activities.filter(success=False).count()
+        total_successful_logins, total_failed_logins = (
+            _success_failure_counts(activities)
+        )
 
         # Calculate total logins (all attempts: successful + failed)
         total_logins = total_successful_logins + total_failed_logins
 
-        # Calculate last login in date range
-        last_login_activity = successful_activities.order_by(
-            '-timestamp'
-        ).first()
-        last_login = (
-            last_login_activity.timestamp if last_login_activity else None
-        )
+        # Count successful logins per (UTC) day in one grouped query and
+        # fold the days into week and month buckets. Grouping by day keeps
+        # the '%Y-%U' (Sunday-based) week keys, which TruncWeek's Monday
+        # weeks would not match.
+        daily_logins = successful_activities.annotate(
+            date=TruncDate('timestamp', tzinfo=datetime.timezone.utc)
+        ).values('date').annotate(
+            count=Count('id'),
+            last_login=Max('timestamp')
+        ).order_by('date')
 
-        # Calculate weekly data
         weekly_data = {}
-        for activity in successful_activities:
-            week_key = activity.timestamp.strftime('%Y-%U')
-            weekly_data[week_key] = weekly_data.get(week_key, 0) + 1
-
-        # Calculate monthly data
         monthly_data = {}
-        for activity in successful_activities:
-            month_key = activity.timestamp.strftime('%Y-%m')
-            monthly_data[month_key] = monthly_data.get(month_key, 0) + 1
+        last_login = None
+        for entry in daily_logins:
+            week_key = entry['date'].strftime('%Y-%U')
+            weekly_data[week_key] = (
+                weekly_data.get(week_key, 0) + entry['count']
+            )
+            month_key = _format_month(entry['date'])
+            monthly_data[month_key] = (
+                monthly_data.get(month_key, 0) + entry['count']
+            )
+            # Days are in order, so the last one holds the latest login
+            last_login = entry['last_login']
 
         # Calculate login trend (simplified - compare first half vs second
         # half of period)
-        if successful_activities.exists():
+        if last_login is not None:
             period_days = (end_date - start_date).days
             midpoint = start_date + timedelta(days=period_days // 2)
 
@@ -217,12 +268,9 @@ def get_user_stats(user, start_date=None, end_date=None):
         user.refresh_from_db()
 
         # Calculate successful and failed from LoginActivity records
-        total_successful_logins = LoginActivity.objects.filter(
-            user=user, success=True
-        ).count()
-        total_failed_logins = LoginActivity.objects.filter(
-            user=user, success=False
-        ).count()
+        total_successful_logins, total_failed_logins = (
+            _success_failure_counts(LoginActivity.objects.filter(user=user))
+        )
 
         # Calculate total logins (all attempts: successful + failed)
         total_logins = total_successful_logins + total_failed_logins
@@ -310,31 +358,27 @@ def get_admin_dashboard_data(
 
     # User statistics
     total_users = users.count()
-    total_logins = LoginActivity.objects.filter(login_filter).count()
-
-    # Calculate successful and failed login counts
-    total_successful_logins = LoginActivity.objects.filter(
-        login_filter & Q(success=True)
-    ).count()
-    total_failed_logins = LoginActivity.objects.filter(
-        login_filter & Q(success=False)
-    ).count()
-
-    # Recent login activity (last 10 activities for filtered users)
-    if me or role or user_ids or filter_type:
-        login_activity = LoginActivity.objects.filter(login_filter) \
-            .select_related('user') \
-            .order_by('-timestamp')[:10]
-    else:
-        login_activity = LoginActivity.objects.filter(login_filter) \
-            .select_related('user') \
-            .order_by('-timestamp')[:10]
+
+    # Calculate successful and failed login counts; every attempt is one
+    # or the other, so together they make up the total
+    total_successful_logins, total_failed_logins = _success_failure_counts(
+        LoginActivity.objects.filter(login_filter)
+    )
+    total_logins = total_successful_logins + total_failed_logins
+
+    # Recent login activity (last 10 activities for filtered users),
+    # formatted by LoginActivitySerializer like the login activity lists
+    login_activity = list(
+        LoginActivity.objects.filter(login_filter)
+        .select_related('user')
+        .order_by('-timestamp')[:10]
+    )
 
     # User growth by month (filtered by role, user_ids, filter_type, or single user)  # noqa: E501
     # Note: User growth is not affected by date filtering as it shows user registration dates  # noqa: E501
     user_growth = defaultdict(int)
     for user in users:
-        join_month = user.date_joined.strftime('%Y-%m')
+        join_month = _format_month(user.date_joined)
         user_growth[join_month] += 1
 
     return {
@@ -360,10 +404,7 @@ def get_login_trends_data(user, start_date=None, end_date=None):
         end_date = timezone.now() + timedelta(minutes=1)
 
     # Optimized query using conditional aggregation
-    login_data = LoginActivity.objects.filter(
-        user=user,
-        timestamp__range=(start_date, end_date)
-    ).annotate(
+    login_data = _base_activity_qs(start_date, end_date, user=user).annotate(
         date=TruncDate('timestamp', tzinfo=timezone.utc)
     ).values('date').annotate(
         successful=Count('id', filter=Q(success=True)),
@@ -386,7 +427,7 @@ def get_login_trends_data(user, start_date=None, end_date=None):
     # Create date to data mapping for fast lookup
     data_map = {}
     for entry in login_data:
-        date_str = entry['date'].strftime('%Y-%m-%d')
+        date_str = _format_day(entry['date'])
         data_map[date_str] = {
             'successful': entry['successful'],
             'failed': entry['failed']
@@ -394,7 +435,7 @@ def get_login_trends_data(user, start_date=None, end_date=None):
 
     # Build complete data arrays
     while current_date < end_date_date:
-        date_str = current_date.strftime('%Y-%m-%d')
+        date_str = _format_day(current_date)
         dates.append(date_str)
 
         if date_str in data_map:
@@ -440,17 +481,15 @@ def get_login_comparison_data(user, start_date=None, end_date=None):
     if date_range <= 30:
         # Use weekly data
         trunc_func = TruncWeek
-        date_format = '%Y-%m-%d'
+        format_label = _format_day
     else:
         # Use monthly data
         trunc_func = TruncMonth
-        date_format = '%Y-%m'
+        format_label = _format_month
 
-    login_data = LoginActivity.objects.filter(
-        user=user,
-        timestamp__range=(start_date, end_date),
-        success=True
-    ).annotate(
+    login_data = _base_activity_qs(
+        start_date, end_date, user=user
+    ).filter(success=True).annotate(
         period=trunc_func('timestamp', tzinfo=datetime.timezone.utc)
     ).values('period').annotate(
         count=Count('id')
@@ -460,7 +499,7 @@ def get_login_comparison_data(user, start_date=None, end_date=None):
     data = []
 
     for entry in login_data:
-        labels.append(entry['period'].strftime(date_format))
+        labels.append(format_label(entry['period']))
         data.append(entry['count'])
 
     return {
@@ -483,24 +522,13 @@ def get_login_distribution_data(user, start_date=None, end_date=None):
     if end_date is None:
         end_date = timezone.now()
 
+    activities = _base_activity_qs(start_date, end_date, user=user)
+
     # Get success/failure ratio
-    success_count = LoginActivity.objects.filter(
-        user=user,
-        timestamp__range=(start_date, end_date),
-        success=True
-    ).count()
-
-    failure_count = LoginActivity.objects.filter(
-        user=user,
-        timestamp__range=(start_date, end_date),
-        success=False
-    ).count()
+    success_count, failure_count = _success_failure_counts(activities)
 
     # Get user agent distribution (top 5)
-    user_agents = LoginActivity.objects.filter(
-        user=user,
-        timestamp__range=(start_date, end_date)
-    ).values('user_agent').annotate(
+    user_agents = activities.values('user_agent').annotate(
         count=Count('id')
     ).order_by('-count')[:5]
 
@@ -539,17 +567,15 @@ def get_combined_login_comparison_data(users, start_date=None, end_date=None):
     if date_range <= 30:
         # Use weekly data
         trunc_func = TruncWeek
-        date_format = '%Y-%m-%d'
+        format_label = _format_day
     else:
         # Use monthly data
         trunc_func = TruncMonth
-        date_format = '%Y-%m'
+        format_label = _format_month
 
-    login_data = LoginActivity.objects.filter(
-        user__in=users,
-        timestamp__range=(start_date, end_date),
-        success=True
-    ).annotate(
+    login_data = _base_activity_qs(
+        start_date, end_date, users=users
+    ).filter(success=True).annotate(
         period=trunc_func('timestamp', tzinfo=datetime.timezone.utc)
     ).values('period').annotate(
         count=Count('id')
@@ -559,7 +585,7 @@ def get_combined_login_comparison_data(users, start_date=None, end_date=None):
     data = []
 
     for entry in login_data:
-        labels.append(entry['period'].strftime(date_format))
+        labels.append(format_label(entry['period']))
         data.append(entry['count'])
 
     return {
@@ -584,24 +610,13 @@ def get_combined_login_distribution_data(
     if end_date is None:
         end_date = timezone.now()
 
+    activities = _base_activity_qs(start_date, end_date, users=users)
+
     # Get success/failure ratio across all users
-    success_count = LoginActivity.objects.filter(
-        user__in=users,
-        timestamp__range=(start_date, end_date),
-        success=True
-    ).count()
-
-    failure_count = LoginActivity.objects.filter(
-        user__in=users,
-        timestamp__range=(start_date, end_date),
-        success=False
-    ).count()
+    success_count, failure_count = _success_failure_counts(activities)
 
     # Get user agent distribution (top 5 across all users)
-    user_agents = LoginActivity.objects.filter(
-        user__in=users,
-        timestamp__range=(start_date, end_date)
-    ).values('user_agent').annotate(
+    user_agents = activities.values('user_agent').annotate(
         count=Count('id')
     ).order_by('-count')[:5]
 
@@ -637,10 +652,7 @@ def get_combined_login_trends_data(users, start_date=None, end_date=None):
         end_date = timezone.now() + timedelta(minutes=1)
 
     # Get login data for all users
-    login_data = LoginActivity.objects.filter(
-        user__in=users,
-        timestamp__range=(start_date, end_date)
-    ).annotate(
+    login_data = _base_activity_qs(start_date, end_date, users=users).annotate(
         date=TruncDate('timestamp', tzinfo=timezone.utc)
     ).values('date').annotate(
         successful=Count('id', filter=Q(success=True)),
@@ -663,7 +675,7 @@ def get_combined_login_trends_data(users, start_date=None, end_date=None):
     # Create date to data mapping for fast lookup
     data_map = {}
     for entry in login_data:
-        date_str = entry['date'].strftime('%Y-%m-%d')
+        date_str = _format_day(entry['date'])
         data_map[date_str] = {
             'successful': entry['successful'],
             'failed': entry['failed']
@@ -671,7 +683,7 @@ def get_combined_login_trends_data(users, start_date=None, end_date=None):
 
     # Build complete data arrays
     while current_date < end_date_date:
-        date_str = current_date.strftime('%Y-%m-%d')
+        date_str = _format_day(current_date)
         dates.append(date_str)
 
         if date_str in data_map:
@@ -721,31 +733,22 @@ def get_admin_chart_data(start_date=None, end_date=None):
         count=Count('id')
     ).order_by('month')
 
+    activities = _base_activity_qs(start_date, end_date)
+
     # Login activity by day
-    login_activity = LoginActivity.objects.filter(
-        timestamp__range=(start_date, end_date),
-        success=True
-    ).annotate(
+    login_activity = activities.filter(success=True).annotate(
         date=TruncDate('timestamp', tzinfo=datetime.timezone.utc)
     ).values('date').annotate(
         count=Count('id')
     ).order_by('date')
 
     # Success ratio
-    success_count = LoginActivity.objects.filter(
-        timestamp__range=(start_date, end_date),
-        success=True
-    ).count()
-
-    failure_count = LoginActivity.objects.filter(
-        timestamp__range=(start_date, end_date),
-        success=False
-    ).count()
+    success_count, failure_count = _success_failure_counts(activities)
 
     return {
         'user_growth': {
             'labels': [
-                entry['month'].strftime('%Y-%m') for entry in user_growth
+                _format_month(entry['month']) for entry in user_growth
             ],
             'datasets': [{
                 'label': 'New Users',
@@ -755,7 +758,7 @@ def get_admin_chart_data(start_date=None, end_date=None):
         },
         'login_activity': {
             'labels': [
-                entry['date'].strftime('%Y-%m-%d') for entry in login_activity
+                _format_day(entry['date']) for entry in login_activity
             ],
             'datasets': [{
                 'label': 'Daily Logins',
@@ -1,5 +1,14 @@
-"""Tests for chart analytics functions."""
-from django.test import TestCase
+"""Tests for chart analytics functions.
+
+These tests only read the shared fixtures, so they stay on TestCase:
+fixtures are created once in setUpTestData and each test is rolled back
+to a savepoint, rather than truncating tables as TransactionTestCase
+would.
+"""
+import os
+from unittest import skipUnless
+
+from django.test import TestCase, tag
 from django.contrib.auth import get_user_model
 from django.utils import timezone
 from datetime import timedelta
@@ -13,87 +22,138 @@ from user.serializers_dashboard import (
 
 User = get_user_model()
 
+# (ip_address, user_agent, age) for each fixture login, built once at import
+_USER1_SUCCESS = tuple(
+    (f'192.168.1.{i+1}', f'Test Browser {i+1}', timedelta(days=i))
+    for i in range(15)
+)
+_USER1_FAILED = tuple(
+    (f'192.168.2.{i+1}', f'Test Browser {i+1}', timedelta(days=i+5))
+    for i in range(5)
+)
+_USER2_SUCCESS = tuple(
+    (f'192.168.3.{i+1}', f'Chrome Browser {i+1}', timedelta(days=i+2))
+    for i in range(8)
+)
 
-class ChartAnalyticsTests(TestCase):
-    """Test cases for chart analytics functions."""
 
-    def setUp(self):
-        """Set up test data."""
-        # Create test users
-        self.user1 = User.objects.create_user(
-            username='user1',
-            email='user1@example.com',
-            password='testpass123'
-        )
-        self.user2 = User.objects.create_user(
-            username='user2',
-            email='user2@example.com',
-            password='testpass123'
-        )
+def _make_user(username, email):
+    """Create a user without hashing a password.
+
+    None of these tests log in, so an unusable password avoids the
+    password hasher entirely.
+    """
+    user = User(username=username, email=email)
+    user.set_unusable_password()
+    user.save()
+    return user
+
+
+def _bulk_load_login_activities(rows, now, batch_size=1000):
+    """Insert login activities with multi-row INSERTs.
+
+    Each row is (user, success, (ip_address, user_agent, age)), with age
+    subtracted from now. Batching keeps large fixture loads under MySQL's
+    max_allowed_packet.
+    """
+    LoginActivity.objects.bulk_create(
+        [
+            LoginActivity(
+                user=user,
+                ip_address=ip_address,
+                user_agent=user_agent,
+                success=success,
+                timestamp=now - age
+            )
+            for user, success, (ip_address, user_agent, age) in rows
+        ],
+        batch_size=batch_size
+    )
 
-        # Create admin user
-        self.admin_user = User.objects.create_superuser(
-            username='admin',
-            email='admin@example.com',
-            password='adminpass123'
-        )
 
-        # Create login activities for testing
-        self._create_test_login_activities()
-
-    def _create_test_login_activities(self):
-        """Create test login activities."""
-        # Create successful logins for user1 (last 30 days)
-        for i in range(15):
-            LoginActivity.objects.create(
-                user=self.user1,
-                ip_address=f'192.168.1.{i+1}',
-                user_agent=f'Test Browser {i+1}',
-                success=True,
-                timestamp=timezone.now() - timedelta(days=i)
-            )
+class ChartAnalyticsTests(TestCase):
+    """Test cases for chart analytics functions."""
 
-        # Create failed logins for user1
-        for i in range(5):
-            LoginActivity.objects.create(
-                user=self.user1,
-                ip_address=f'192.168.2.{i+1}',
-                user_agent=f'Test Browser {i+1}',
-                success=False,
-                timestamp=timezone.now() - timedelta(days=i+5)
-            )
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data once for the whole class.
 
-        # Create successful logins for user2
-        for i in range(8):
-            LoginActivity.objects.create(
-                user=self.user2,
-                ip_address=f'192.168.3.{i+1}',
-                user_agent=f'Chrome Browser {i+1}',
-                success=True,
-                timestamp=timezone.now() - timedelta(days=i+2)
-            )
+        TestCase.setUpClass already wraps this in one class-wide atomic
+        block that is rolled back in tearDownClass, so the rows are
+        inserted once and never truncated.
+        """
+        # Every timestamp and date range is relative to this single instant,
+        # so day boundaries cannot shift between setup and the assertions
+        cls.now = timezone.now()
 
-    def test_get_login_trends_data_returns_correct_structure(self):
-        """Test that get_login_trends_data returns correct structure."""
-        result = get_login_trends_data(self.user1)
+        # Create test users
+        cls.user1 = _make_user('user1', 'user1@example.com')
+        cls.user2 = _make_user('user2', 'user2@example.com')
 
-        self.assertIn('labels', result)
-        self.assertIn('datasets', result)
-        self.assertIsInstance(result['labels'], list)
-        self.assertIsInstance(result['datasets'], list)
-        self.assertTrue(len(result['datasets']) > 0)
+        # Create login activities for testing
+        cls._create_test_login_activities()
+
+    @classmethod
+    def _create_test_login_activities(cls):
+        """Create test login activities in a single bulk insert."""
+        _bulk_load_login_activities(
+            # Successful logins for user1 (last 30 days)
+            [(cls.user1, True, row) for row in _USER1_SUCCESS]
+            # Failed logins for user1
+            + [(cls.user1, False, row) for row in _USER1_FAILED]
+            # Successful logins for user2
+            + [(cls.user2, True, row) for row in _USER2_SUCCESS],
+            cls.now
+        )
 
-        # Check dataset structure
-        dataset = result['datasets'][0]
-        self.assertIn('label', dataset)
-        self.assertIn('data', dataset)
-        self.assertIn('borderColor', dataset)
-        self.assertIsInstance(dataset['data'], list)
+    def test_chart_functions_return_correct_structure(self):
+        """Test that every chart function returns Chart.js structure
+        within its query budget."""
+        # (name, function, args, query budget, chart keys, dataset keys)
+        # chart keys of None means the result itself is a single chart
+        cases = (
+            # One grouped query for successful and failed logins per day
+            ('trends', get_login_trends_data, (self.user1,), 1,
+             None, ('label', 'data', 'borderColor')),
+            # One grouped query for logins per period
+            ('comparison', get_login_comparison_data, (self.user1,), 1,
+             None, ('label', 'data')),
+            # Success/failure counts and top user agents
+            ('distribution', get_login_distribution_data, (self.user1,), 2,
+             ('success_ratio', 'user_agents'), ('data', 'backgroundColor')),
+            # User growth, daily logins and success/failure counts
+            ('admin', get_admin_chart_data, (), 3,
+             ('user_growth', 'login_activity', 'success_ratio'),
+             ('label', 'data', 'borderColor')),
+        )
+
+        for name, func, args, num_queries, chart_keys, dataset_keys in cases:
+            with self.subTest(chart=name):
+                with self.assertNumQueries(num_queries):
+                    result = func(*args)
+
+                if chart_keys is None:
+                    charts = [result]
+                else:
+                    for key in chart_keys:
+                        self.assertIn(key, result)
+                    charts = [result[key] for key in chart_keys]
+
+                for chart in charts:
+                    self.assertIsInstance(chart['labels'], list)
+                    self.assertIsInstance(chart['datasets'], list)
+                    self.assertTrue(len(chart['datasets']) > 0)
+
+                # Check the first dataset of the first chart
+                dataset = charts[0]['datasets'][0]
+                for key in dataset_keys:
+                    self.assertIn(key, dataset)
+                self.assertIsInstance(dataset['data'], list)
 
     def test_get_login_trends_data_with_date_range(self):
         """Test get_login_trends_data with custom date range."""
-        start_date = timezone.now() - timedelta(days=7)
-        end_date = timezone.now()
+        start_date = self.now - timedelta(days=7)
+        end_date = self.now
 
         result = get_login_trends_data(
             self.user1,
@@ -104,51 +164,6 @@ class ChartAnalyticsTests(TestCase):
         self.assertIsInstance(result, dict)
         self.assertIn('labels', result)
 
-    def test_get_login_comparison_data_returns_correct_structure(self):
-        """Test that get_login_comparison_data returns correct structure."""
-        result = get_login_comparison_data(self.user1)
-
-        self.assertIn('labels', result)
-        self.assertIn('datasets', result)
-        self.assertIsInstance(result['labels'], list)
-        self.assertIsInstance(result['datasets'], list)
-        self.assertTrue(len(result['datasets']) > 0)
-
-    def test_get_login_distribution_data_returns_correct_structure(self):
-        """Test that get_login_distribution_data returns correct structure."""
-        result = get_login_distribution_data(self.user1)
-
-        self.assertIn('success_ratio', result)
-        self.assertIn('user_agents', result)
-
-        # Check success ratio structure
-        self.assertIn('labels', result['success_ratio'])
-        self.assertIn('datasets', result['success_ratio'])
-        self.assertIsInstance(result['success_ratio']['labels'], list)
-        self.assertIsInstance(result['success_ratio']['datasets'], list)
-
-        # Check user agents structure
-        self.assertIn('labels', result['user_agents'])
-        self.assertIn('datasets', result['user_agents'])
-        self.assertIsInstance(result['user_agents']['labels'], list)
-        self.assertIsInstance(result['user_agents']['datasets'], list)
-
-        # For pie charts, should have backgroundColor
-        dataset = result['success_ratio']['datasets'][0]
-        self.assertIn('backgroundColor', dataset)
-
-    def test_get_admin_chart_data_returns_correct_structure(self):
-        """Test that get_admin_chart_data returns correct structure."""
-        result = get_admin_chart_data()
-
-        self.assertIn('user_growth', result)
-        self.assertIn('login_activity', result)
-        self.assertIn('success_ratio', result)
-
-        # Check each chart data structure
-        self.assertIn('labels', result['user_growth'])
-        self.assertIn('datasets', result['user_growth'])
-
     def test_get_login_trends_data_includes_success_and_failed_data(self):
         """Test that login trends includes both successful and failed data."""
         result = get_login_trends_data(self.user1)
@@ -164,42 +179,67 @@ class ChartAnalyticsTests(TestCase):
         """Test that distribution data includes correct success/failure ratios."""  # noqa: E501
         result = get_login_distribution_data(self.user1)
 
-        dataset = result['success_ratio']['datasets'][0]
-        total_logins = sum(dataset['data'])
+        counts = result['success_ratio']['datasets'][0]['data']
+        total_logins = sum(counts)
 
         # Should have 2 data points (successful and failed)
-        self.assertEqual(len(dataset['data']), 2)
+        self.assertEqual(len(counts), 2)
         self.assertEqual(total_logins, 20)  # 15 successful + 5 failed
 
-    def test_empty_data_returns_valid_structure(self):
-        """Test that functions return valid structure even with empty data."""
-        # Create user with no login activities
-        new_user = User.objects.create_user(
-            username='newuser',
-            email='new@example.com',
-            password='testpass123'
+    @tag('perf')
+    @skipUnless(
+        os.environ.get('RUN_PERF_TESTS'),
+        'Inserts 10,000 rows; set RUN_PERF_TESTS=1 to run it'
+    )
+    def test_get_login_distribution_data_scales(self):
+        """Test that distribution counts are aggregated in the database,
+        so the query count does not grow with the number of rows."""
+        _bulk_load_login_activities(
+            [
+                (self.user1, i % 4 != 0,
+                 ('10.0.0.1', f'Load Browser {i % 3}', timedelta(minutes=i)))
+                for i in range(10000)
+            ],
+            self.now
+        )
+
+        with self.assertNumQueries(2):
+            result = get_login_distribution_data(self.user1)
+
+        # 15 successful and 5 failed fixture logins plus the loaded rows
+        self.assertEqual(
+            result['success_ratio']['datasets'][0]['data'],
+            [15 + 7500, 5 + 2500]
         )
 
-        result = get_login_trends_data(new_user)
+    def test_empty_data_returns_valid_structure(self):
+        """Test that functions return valid structure even with empty data."""
+        # Auto-increment primary keys start at 1, so no user has id 0 and
+        # there is no need to create (and hash a password for) a new user
+        with self.assertNumQueries(1):
+            result = get_login_trends_data(0)
         self.assertIn('labels', result)
         self.assertIn('datasets', result)
 
         # Should still have datasets but with zero data
         self.assertTrue(len(result['datasets']) > 0)
-        for dataset in result['datasets']:
-            self.assertEqual(sum(dataset['data']), 0)
+        self.assertTrue(
+            all(not any(dataset['data']) for dataset in result['datasets'])
+        )
 
     def test_date_range_filtering_works_correctly(self):
         """Test that date range filtering works correctly."""
         # Get data for last 7 days only (inclusive of both start and end dates)
-        start_date = timezone.now() - timedelta(days=7)
-        end_date = timezone.now()
-
-        result = get_login_trends_data(
-            self.user1,
-            start_date=start_date,
-            end_date=end_date
-        )
+        start_date = self.now - timedelta(days=7)
+        end_date = self.now
+
+        # One grouped query covers every day, not one query per day
+        with self.assertNumQueries(1):
+            result = get_login_trends_data(
+                self.user1,
+                start_date=start_date,
+                end_date=end_date
+            )
 
         # Should have data for the specified range
         self.assertIsInstance(result, dict)
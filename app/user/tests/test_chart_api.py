@@ -1,210 +1,379 @@
 """Tests for chart API endpoints."""
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.contrib.auth import get_user_model
-from django.urls import reverse
-from rest_framework.test import APIClient
+from django.db import connection
+from django.urls import resolve, reverse
+from rest_framework.test import (
+    APIClient,
+    APIRequestFactory,
+    force_authenticate
+)
 from rest_framework import status
 from core.models import LoginActivity
-from datetime import timedelta
+from user.serializers_dashboard import get_login_trends_data
+from datetime import date, timedelta
 from django.utils import timezone
+from user.tests.utils import LOCMEM_CACHES
 
 User = get_user_model()
 
+# (ip_address, user_agent, age) for each fixture login, built once at import
+_USER_SUCCESS = tuple(
+    (f'192.168.1.{i+1}', f'Test Browser {i+1}', timedelta(days=i))
+    for i in range(15)
+)
+_USER_FAILED = tuple(
+    (f'192.168.2.{i+1}', f'Test Browser {i+1}', timedelta(days=i+5))
+    for i in range(5)
+)
+_ADMIN_SUCCESS = tuple(
+    (f'192.168.3.{i+1}', f'Chrome Browser {i+1}', timedelta(days=i+2))
+    for i in range(8)
+)
+
+
+def _insert_login_activities(rows, now):
+    """Insert login activities with raw SQL, bypassing model instances.
+
+    Each row is (user, success, (ip_address, user_agent, age)), with age
+    subtracted from now. Skipping the ORM avoids building a LoginActivity
+    per row, which matters once fixtures grow to thousands of rows; like
+    bulk_create it also skips LoginActivity.save(), so user login
+    statistics are not updated.
+    """
+    opts = LoginActivity._meta
+    columns = [
+        opts.get_field(name).column
+        for name in ('user', 'ip_address', 'user_agent', 'success',
+                     'timestamp')
+    ]
+    sql = 'INSERT INTO {} ({}) VALUES ({})'.format(
+        connection.ops.quote_name(opts.db_table),
+        ', '.join(connection.ops.quote_name(column) for column in columns),
+        ', '.join(['%s'] * len(columns))
+    )
+    params = [
+        (
+            user.pk,
+            ip_address,
+            user_agent,
+            success,
+            connection.ops.adapt_datetimefield_value(now - age)
+        )
+        for user, success, (ip_address, user_agent, age) in rows
+    ]
+    with connection.cursor() as cursor:
+        cursor.executemany(sql, params)
+
+
+class ChartAPIAuthRequiredTests(SimpleTestCase):
+    """Test that chart endpoints reject anonymous requests.
+
+    Anonymous requests are rejected before any query runs, so these tests
+    need neither fixtures nor a database transaction.
+    """
+
+    client_class = APIClient
+
+    def test_all_chart_endpoints_require_authentication(self):
+        """Test that the user chart endpoints require authentication."""
+        for url in (
+            reverse('user:login-trends'),
+            reverse('user:login-comparison'),
+            reverse('user:login-distribution')
+        ):
+            with self.subTest(url=url):
+                response = self.client.get(url)
+                self.assertEqual(
+                    response.status_code, status.HTTP_401_UNAUTHORIZED
+                )
+
 
 class ChartAPITests(TestCase):
     """Test cases for chart API endpoints."""
 
-    def setUp(self):
-        """Set up test data."""
+    client_class = APIClient
+
+    INVALID_DATES = (
+        'invalid-date',
+        'not-a-date',
+        '2023-13-01',  # Invalid month
+        '2023-01-32',  # Invalid day
+        '2023/01/01',  # Wrong separator
+        '2023-01-01-extra',  # Extra characters
+    )
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data once for the whole class.
+
+        Tests only read these users and login activities, so the fixtures
+        are never reseeded between tests.
+        """
         # Create test users
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
 
-        self.admin_user = User.objects.create_superuser(
+        cls.admin_user = User.objects.create_superuser(
             username='admin',
             email='admin@example.com',
             password='adminpass123'
         )
 
-        # Create login activities for testing
-        self._create_test_login_activities()
-
-        # Setup API client
-        self.client = APIClient()
-
-    def _create_test_login_activities(self):
-        """Create test login activities."""
-        # Create successful logins for user (last 30 days)
-        for i in range(15):
-            LoginActivity.objects.create(
-                user=self.user,
-                ip_address=f'192.168.1.{i+1}',
-                user_agent=f'Test Browser {i+1}',
-                success=True,
-                timestamp=timezone.now() - timedelta(days=i)
-            )
-
-        # Create failed logins for user
-        for i in range(5):
-            LoginActivity.objects.create(
-                user=self.user,
-                ip_address=f'192.168.2.{i+1}',
-                user_agent=f'Test Browser {i+1}',
-                success=False,
-                timestamp=timezone.now() - timedelta(days=i+5)
-            )
-
-        # Create successful logins for admin user
-        for i in range(8):
-            LoginActivity.objects.create(
-                user=self.admin_user,
-                ip_address=f'192.168.3.{i+1}',
-                user_agent=f'Chrome Browser {i+1}',
-                success=True,
-                timestamp=timezone.now() - timedelta(days=i+2)
-            )
-
-    def test_login_trends_endpoint_requires_authentication(self):
-        """Test that login trends endpoint requires authentication."""
-        url = reverse('user:login-trends')
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
-
-    def test_login_trends_endpoint_returns_correct_data(self):
-        """Test that login trends endpoint returns correct data structure."""
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:login-trends')
-
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # User with no login activities
+        cls.empty_user = User.objects.create_user(
+            username='newuser',
+            email='new@example.com',
+            password='testpass123'
+        )
 
-        data = response.data
-        self.assertIn('login_trends', data)
-        self.assertIn('labels', data['login_trends'])
-        self.assertIn('datasets', data['login_trends'])
-        self.assertIsInstance(data['login_trends']['labels'], list)
-        self.assertIsInstance(data['login_trends']['datasets'], list)
+        # Every timestamp and date string is relative to this single
+        # instant, so day boundaries cannot shift between the inserted rows
+        # and the date filters
+        cls.now = timezone.now()
 
-    def test_login_trends_with_date_range(self):
-        """Test login trends endpoint with date range parameters."""
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:login-trends')
+        # Create login activities for testing
+        cls._create_test_login_activities()
 
-        # Test with date range
-        start_date = (timezone.now() - timedelta(days=7)).strftime('%Y-%m-%d')
-        end_date = timezone.now().strftime('%Y-%m-%d')
+        # Format the request date strings once
+        cls.today_str = cls.now.strftime('%Y-%m-%d')
+        cls.days_ago_str = {
+            days: (cls.now - timedelta(days=days)).strftime('%Y-%m-%d')
+            for days in (3, 7, 10, 14, 60)
+        }
 
-        response = self.client.get(url, {
-            'start_date': start_date,
-            'end_date': end_date
-        })
+        # Reverse the endpoint URLs once
+        cls.trends_url = reverse('user:login-trends')
+        cls.comparison_url = reverse('user:login-comparison')
+        cls.distribution_url = reverse('user:login-distribution')
+        cls.admin_url = reverse('user:admin-charts')
 
+    def setUp(self):
+        """Set up pre-authenticated API clients."""
+        # Ask for JSON up front so DRF picks the renderer without
+        # negotiating across every registered renderer
+        self.user_client = APIClient(HTTP_ACCEPT='application/json')
+        self.user_client.force_authenticate(user=self.user)
+        self.admin_client = APIClient(HTTP_ACCEPT='application/json')
+        self.admin_client.force_authenticate(user=self.admin_user)
+
+    def get_ok(self, client, url, params=None):
+        """GET url with client, assert 200 OK and return the payload."""
+        response = client.get(url, params)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn('login_trends', response.data)
+        return response.data
+
+    @classmethod
+    def _create_test_login_activities(cls):
+        """Create test login activities with one raw multi-row insert."""
+        _insert_login_activities(
+            # Successful logins for user (last 30 days)
+            [(cls.user, True, row) for row in _USER_SUCCESS]
+            # Failed logins for user
+            + [(cls.user, False, row) for row in _USER_FAILED]
+            # Successful logins for admin user
+            + [(cls.admin_user, True, row) for row in _ADMIN_SUCCESS],
+            cls.now
+        )
 
-    def test_login_comparison_endpoint_requires_authentication(self):
-        """Test that login comparison endpoint requires authentication."""
-        url = reverse('user:login-comparison')
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+    def test_chart_endpoints_return_correct_data(self):
+        """Test that the user chart endpoints return Chart.js structure
+        within their query budgets."""
+        # (url, response key, query budget, charts in the response)
+        # charts of None means the response value is itself one chart
+        cases = (
+            # One grouped query for successful and failed logins per day
+            (self.trends_url, 'login_trends', 1, None),
+            # One grouped query for logins per period
+            (self.comparison_url, 'login_comparison', 1, None),
+            # Success/failure counts and top user agents
+            (self.distribution_url, 'login_distribution', 2,
+             ('success_ratio', 'user_agents')),
+        )
 
-    def test_login_comparison_endpoint_returns_correct_data(self):
-        """Test that login comparison endpoint returns correct data structure."""  # noqa: E501
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:login-comparison')
+        for url, key, num_queries, chart_keys in cases:
+            with self.subTest(endpoint=key):
+                # Plus the data version the chart cache is keyed on (2)
+                with self.assertNumQueries(num_queries + 2):
+                    response = self.user_client.get(url)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertIn(key, response.data)
+                data = response.data[key]
+
+                if chart_keys is None:
+                    charts = [data]
+                else:
+                    self.assertLessEqual(set(chart_keys), data.keys())
+                    charts = [data[chart] for chart in chart_keys]
+                for chart in charts:
+                    self.assertLessEqual(
+                        {'labels', 'datasets'}, chart.keys()
+                    )
+                    self.assertIsInstance(chart['labels'], list)
+                    self.assertIsInstance(chart['datasets'], list)
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_chart_endpoints_cache_data_per_user(self):
+        """Test that repeated chart requests for the same user and date
+        range are served from cache."""
+        cache.clear()
+        self.addCleanup(cache.clear)
+        params = {
+            'start_date': self.days_ago_str[7],
+            'end_date': self.today_str
+        }
+        cases = (
+            (self.trends_url, 'login_trends', 1),
+            (self.comparison_url, 'login_comparison', 1),
+            (self.distribution_url, 'login_distribution', 2),
+        )
 
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Only the first request reads the data version (2 queries)
+        version_queries = 2
+
+        for url, key, num_queries in cases:
+            with self.subTest(endpoint=key):
+                with self.assertNumQueries(num_queries + version_queries):
+                    first = self.get_ok(self.user_client, url, params)
+                version_queries = 0
+                with self.assertNumQueries(0):
+                    second = self.get_ok(self.user_client, url, params)
+                self.assertEqual(first, second)
+
+                # Another user and another date range are computed separately
+                with self.assertNumQueries(num_queries):
+                    other = self.get_ok(self.admin_client, url, params)
+                self.assertNotEqual(first, other)
+                with self.assertNumQueries(num_queries):
+                    self.get_ok(self.user_client, url)
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_chart_cache_follows_data_version(self):
+        """Test that a new login is charted once the data version moves
+        on, without waiting for the chart cache to expire."""
+        cache.clear()
+        self.addCleanup(cache.clear)
+        url = self.distribution_url
+
+        def success_counts():
+            data = self.get_ok(self.user_client, url)['login_distribution']
+            return data['success_ratio']['datasets'][0]['data']
+
+        self.assertEqual(success_counts(), [15, 5])
+        LoginActivity.objects.create(
+            user=self.user,
+            ip_address='192.168.9.9',
+            user_agent='New Browser',
+            success=True
+        )
+        # As if the cached data version had expired
+        cache.delete('admin_dashboard_etag_version')
 
-        data = response.data
-        self.assertIn('login_comparison', data)
-        self.assertIn('labels', data['login_comparison'])
-        self.assertIn('datasets', data['login_comparison'])
-        self.assertIsInstance(data['login_comparison']['labels'], list)
-        self.assertIsInstance(data['login_comparison']['datasets'], list)
-
-    def test_login_distribution_endpoint_requires_authentication(self):
-        """Test that login distribution endpoint requires authentication."""
-        url = reverse('user:login-distribution')
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
-
-    def test_login_distribution_endpoint_returns_correct_data(self):
-        """Test that login distribution endpoint returns correct data structure."""  # noqa: E501
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:login-distribution')
-
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(success_counts(), [16, 5])
 
-        data = response.data
-        self.assertIn('login_distribution', data)
-        self.assertIn('success_ratio', data['login_distribution'])
-        self.assertIn('user_agents', data['login_distribution'])
+    def test_login_trends_with_date_range(self):
+        """Test login trends endpoint with date range parameters."""
+        url = self.trends_url
 
-        # Check success ratio structure
-        self.assertIn('labels', data['login_distribution']['success_ratio'])
-        self.assertIn('datasets', data['login_distribution']['success_ratio'])
+        # Test with date range
+        start_date = self.days_ago_str[7]
+        end_date = self.today_str
 
-        # Check user agents structure
-        self.assertIn('labels', data['login_distribution']['user_agents'])
-        self.assertIn('datasets', data['login_distribution']['user_agents'])
+        payload = self.get_ok(self.user_client, url, {
+            'start_date': start_date,
+            'end_date': end_date
+        })
+        self.assertIn('login_trends', payload)
 
     def test_admin_charts_endpoint_requires_admin_permissions(self):
         """Test that admin charts endpoint requires admin permissions."""
         # Test with regular user
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:admin-charts')
-        response = self.client.get(url)
+        url = self.admin_url
+        response = self.user_client.get(url)
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
         # Test with admin user
-        self.client.force_authenticate(user=self.admin_user)
-        response = self.client.get(url)
+        response = self.admin_client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
     def test_admin_charts_endpoint_returns_correct_data(self):
         """Test that admin charts endpoint returns correct data structure."""
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:admin-charts')
+        url = self.admin_url
 
-        response = self.client.get(url)
+        # User growth, daily logins and success/failure counts, plus the
+        # data version the admin chart cache is keyed on (2)
+        with self.assertNumQueries(5):
+            response = self.admin_client.get(url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         data = response.data
         self.assertIn('admin_charts', data)
-        self.assertIn('user_growth', data['admin_charts'])
-        self.assertIn('login_activity', data['admin_charts'])
-        self.assertIn('success_ratio', data['admin_charts'])
+        self.assertLessEqual(
+            {'user_growth', 'login_activity', 'success_ratio'},
+            data['admin_charts'].keys()
+        )
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_admin_charts_are_cached_per_date_range(self):
+        """Test that repeated admin chart requests are served from cache
+        until the data version moves on."""
+        cache.clear()
+        self.addCleanup(cache.clear)
+        url = self.admin_url
+        params = {
+            'start_date': self.days_ago_str[7],
+            'end_date': self.today_str
+        }
+
+        # Data version (2) and the admin chart queries (3)
+        with self.assertNumQueries(5):
+            first = self.get_ok(self.admin_client, url, params)
+        with self.assertNumQueries(0):
+            second = self.get_ok(self.admin_client, url, params)
+        self.assertEqual(first, second)
+
+        # Another date range is computed separately
+        with self.assertNumQueries(3):
+            self.get_ok(self.admin_client, url)
+
+        # A new login shows up once the data version moves on
+        LoginActivity.objects.create(
+            user=self.user,
+            ip_address='192.168.9.9',
+            user_agent='New Browser',
+            success=True
+        )
+        cache.delete('admin_dashboard_etag_version')
+        third = self.get_ok(self.admin_client, url, params)
+        ratio = 'success_ratio'
+        self.assertEqual(
+            sum(third['admin_charts'][ratio]['datasets'][0]['data']),
+            sum(first['admin_charts'][ratio]['datasets'][0]['data']) + 1
+        )
 
     def test_admin_charts_with_date_range(self):
         """Test admin charts endpoint with date range parameters."""
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:admin-charts')
+        url = self.admin_url
 
         # Test with date range
-        start_date = (
-            timezone.now() - timedelta(days=14)
-        ).strftime('%Y-%m-%d')
-        end_date = timezone.now().strftime('%Y-%m-%d')
+        start_date = self.days_ago_str[14]
+        end_date = self.today_str
 
-        response = self.client.get(url, {
+        payload = self.get_ok(self.admin_client, url, {
             'start_date': start_date,
             'end_date': end_date
         })
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn('admin_charts', response.data)
+        self.assertIn('admin_charts', payload)
 
     def test_invalid_date_format_returns_error(self):
         """Test that invalid date format returns appropriate error."""
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:login-trends')
+        url = self.trends_url
 
-        response = self.client.get(url, {
+        response = self.user_client.get(url, {
             'start_date': 'invalid-date',
             'end_date': '2023-01-01'
         })
@@ -217,20 +386,13 @@ class ChartAPITests(TestCase):
 
     def test_empty_data_returns_valid_structure(self):
         """Test that endpoints return valid structure even with no data."""
-        # Create a new user with no login activities
-        new_user = User.objects.create_user(
-            username='newuser',
-            email='new@example.com',
-            password='testpass123'
-        )
-
-        self.client.force_authenticate(user=new_user)
+        self.client.force_authenticate(user=self.empty_user)
 
         # Test all endpoints
         endpoints = [
-            reverse('user:login-trends'),
-            reverse('user:login-comparison'),
-            reverse('user:login-distribution')
+            self.trends_url,
+            self.comparison_url,
+            self.distribution_url
         ]
 
         for url in endpoints:
@@ -241,27 +403,21 @@ class ChartAPITests(TestCase):
     def test_login_trends_includes_both_successful_and_failed_logins(self):
         """Test that login trends includes both successful and
         failed login data."""
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:login-trends')
+        url = self.trends_url
 
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-
-        data = response.data['login_trends']
+        data = self.get_ok(self.user_client, url)['login_trends']
         datasets = data['datasets']
 
         # Should have two datasets: successful and failed logins
         self.assertEqual(len(datasets), 2)
 
-        labels = [ds['label'] for ds in datasets]
-        self.assertIn('Successful Logins', labels)
-        self.assertIn('Failed Logins', labels)
+        by_label = {ds['label']: ds for ds in datasets}
+        self.assertIn('Successful Logins', by_label)
+        self.assertIn('Failed Logins', by_label)
 
         # Verify both datasets have data
-        successful_data = next(
-            ds for ds in datasets if ds['label'] == 'Successful Logins')
-        failed_data = next(
-            ds for ds in datasets if ds['label'] == 'Failed Logins')
+        successful_data = by_label['Successful Logins']
+        failed_data = by_label['Failed Logins']
 
         # Should have successful logins
         self.assertGreater(sum(successful_data['data']), 0)
@@ -270,55 +426,39 @@ class ChartAPITests(TestCase):
 
     def test_login_trends_date_filtration_works_correctly(self):
         """Test that login trends date filtration works correctly."""
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:login-trends')
+        url = self.trends_url
 
         # Test with specific date range (last 3 days only)
-        start_date = (timezone.now() - timedelta(days=3)).strftime('%Y-%m-%d')
-        end_date = timezone.now().strftime('%Y-%m-%d')
+        start_date = self.days_ago_str[3]
+        end_date = self.today_str
 
-        response = self.client.get(url, {
+        data = self.get_ok(self.user_client, url, {
             'start_date': start_date,
             'end_date': end_date
-        })
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        data = response.data['login_trends']
+        })['login_trends']
 
         # Should have data for exactly 4 days (start date + 3 days)
         self.assertEqual(len(data['labels']), 4)
 
         # Verify dates are within the requested range
+        start_date_obj = date.fromisoformat(start_date)
+        end_date_obj = date.fromisoformat(end_date)
         for date_str in data['labels']:
-            response_date = timezone.datetime.strptime(
-                date_str, '%Y-%m-%d'
-            ).date()
-            start_date_obj = timezone.datetime.strptime(
-                start_date, '%Y-%m-%d'
-            ).date()
-            end_date_obj = timezone.datetime.strptime(
-                end_date, '%Y-%m-%d'
-            ).date()
+            response_date = date.fromisoformat(date_str)
             self.assertTrue(start_date_obj <= response_date <= end_date_obj)
 
     def test_login_comparison_date_filtration_works_correctly(self):
         """Test that login comparison date filtration works correctly."""
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:login-comparison')
+        url = self.comparison_url
 
         # Test with specific date range
-        start_date = (
-            timezone.now() - timedelta(days=10)
-        ).strftime('%Y-%m-%d')
-        end_date = timezone.now().strftime('%Y-%m-%d')
+        start_date = self.days_ago_str[10]
+        end_date = self.today_str
 
-        response = self.client.get(url, {
+        data = self.get_ok(self.user_client, url, {
             'start_date': start_date,
             'end_date': end_date
-        })
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        data = response.data['login_comparison']
+        })['login_comparison']
 
         # Should return data structure
         self.assertIn('labels', data)
@@ -329,100 +469,114 @@ class ChartAPITests(TestCase):
     def test_login_distribution_includes_correct_success_failure_ratio(self):
         """Test that login distribution includes correct
         success/failure ratio."""
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:login-distribution')
-
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        url = self.distribution_url
 
-        data = response.data['login_distribution']
+        data = self.get_ok(self.user_client, url)['login_distribution']
         success_ratio = data['success_ratio']
 
         # Should have correct structure
         self.assertEqual(success_ratio['labels'], ['Successful', 'Failed'])
         self.assertEqual(len(success_ratio['datasets']), 1)
 
-        dataset = success_ratio['datasets'][0]
-        self.assertEqual(len(dataset['data']), 2)
-        self.assertEqual(sum(dataset['data']), 20)  # 15 successful + 5 failed
+        counts = success_ratio['datasets'][0]['data']
+        self.assertEqual(len(counts), 2)
+        self.assertEqual(sum(counts), 20)  # 15 successful + 5 failed
 
         # Verify ratio is correct (15 successful, 5 failed)
-        self.assertEqual(dataset['data'][0], 15)  # Successful logins
-        self.assertEqual(dataset['data'][1], 5)   # Failed logins
+        self.assertEqual(counts[0], 15)  # Successful logins
+        self.assertEqual(counts[1], 5)   # Failed logins
 
     def test_login_trends_with_same_start_and_end_date(self):
         """Test login trends with same start and end date."""
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:login-trends')
+        url = self.trends_url
 
         # Test with same date
-        same_date = timezone.now().strftime('%Y-%m-%d')
+        same_date = self.today_str
 
-        response = self.client.get(url, {
+        data = self.get_ok(self.user_client, url, {
             'start_date': same_date,
             'end_date': same_date
-        })
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        data = response.data['login_trends']
+        })['login_trends']
 
         # Should return data for exactly one day
         self.assertEqual(len(data['labels']), 1)
         self.assertEqual(data['labels'][0], same_date)
 
-    def test_login_trends_with_user_ids_parameter_admin_only(self):
-        """Test login trends endpoint with user_ids parameter (admin only)."""
-        # Test with regular user - should fail
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:login-trends')
-
-        response = self.client.get(
-            url, {'user_ids[]': [self.admin_user.id]})
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
-
-        # Test with admin user - should succeed
-        self.client.force_authenticate(user=self.admin_user)
-        response = self.client.get(
-            url, {'user_ids[]': [self.user.id, self.admin_user.id]})
+    def test_chart_endpoints_user_ids_parameter_admin_only(self):
+        """Test that the user_ids parameter is admin only on every user
+        chart endpoint and returns combined data for admins."""
+        # (url, response key, expected dataset count or None for pie data)
+        cases = (
+            (self.trends_url, 'login_trends', 2),  # Successful and failed
+            (self.comparison_url, 'login_comparison', 1),
+            (self.distribution_url, 'login_distribution', None),
+        )
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn('login_trends', response.data)
-
-        # Should have combined data structure
-        data = response.data['login_trends']
-        self.assertIn('labels', data)
-        self.assertIn('datasets', data)
-        self.assertEqual(len(data['datasets']), 2)  # Successful and failed
-        # logins
+        for url, key, dataset_count in cases:
+            with self.subTest(endpoint=key):
+                # Test with regular user - should fail
+                response = self.user_client.get(
+                    url, {'user_ids[]': [self.admin_user.id]})
+                self.assertEqual(
+                    response.status_code, status.HTTP_403_FORBIDDEN
+                )
+
+                # Test with admin user - should succeed
+                response = self.admin_client.get(
+                    url, {'user_ids[]': [self.user.id, self.admin_user.id]})
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertIn(key, response.data)
+                data = response.data[key]
+
+                if dataset_count is not None:
+                    # Should have combined data structure
+                    self.assertLessEqual({'labels', 'datasets'}, data.keys())
+                    self.assertEqual(len(data['datasets']), dataset_count)
+                    continue
+
+                # Should have combined distribution data structure
+                self.assertLessEqual(
+                    {'success_ratio', 'user_agents'}, data.keys()
+                )
+                for chart in ('success_ratio', 'user_agents'):
+                    self.assertLessEqual(
+                        {'labels', 'datasets'}, data[chart].keys()
+                    )
+                success_ratio = data['success_ratio']
+                self.assertEqual(
+                    success_ratio['labels'], ['Successful', 'Failed']
+                )
+                # Should include logins from both users
+                self.assertGreater(
+                    sum(success_ratio['datasets'][0]['data']), 0
+                )
 
     def test_login_trends_invalid_user_ids_format(self):
         """Test login trends with invalid user_ids format."""
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:login-trends')
+        url = self.trends_url
 
-        response = self.client.get(url, {'user_ids[]': 'invalid'})
+        response = self.admin_client.get(url, {'user_ids[]': 'invalid'})
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('error', response.data)
 
     def test_login_trends_nonexistent_user_ids(self):
         """Test login trends with nonexistent user IDs."""
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:login-trends')
+        url = self.trends_url
 
-        response = self.client.get(url, {'user_ids[]': [99999]})
+        response = self.admin_client.get(url, {'user_ids[]': [99999]})
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('error', response.data)
 
     def test_login_trends_with_reversed_date_range(self):
         """Test login trends with reversed date range (start > end)."""
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:login-trends')
+        url = self.trends_url
 
         # Test with reversed dates (start date after end date)
-        start_date = timezone.now().strftime('%Y-%m-%d')
-        end_date = (timezone.now() - timedelta(days=7)).strftime('%Y-%m-%d')
+        start_date = self.today_str
+        end_date = self.days_ago_str[7]
 
-        response = self.client.get(url, {
+        response = self.user_client.get(url, {
             'start_date': start_date,
             'end_date': end_date
         })
@@ -440,23 +594,18 @@ class ChartAPITests(TestCase):
     def test_login_comparison_auto_adjusts_timeframe_based_on_range(self):
         """Test that login comparison automatically adjusts timeframe
         based on date range."""
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:login-comparison')
+        url = self.comparison_url
 
         # Test short range (should use weekly data)
-        response_short = self.client.get(url, {
-            'start_date': (
-                timezone.now() - timedelta(days=7)
-            ).strftime('%Y-%m-%d'),
-            'end_date': timezone.now().strftime('%Y-%m-%d')
+        response_short = self.user_client.get(url, {
+            'start_date': self.days_ago_str[7],
+            'end_date': self.today_str
         })
 
         # Test long range (should use monthly data)
-        response_long = self.client.get(url, {
-            'start_date': (
-                timezone.now() - timedelta(days=60)
-            ).strftime('%Y-%m-%d'),
-            'end_date': timezone.now().strftime('%Y-%m-%d')
+        response_long = self.user_client.get(url, {
+            'start_date': self.days_ago_str[60],
+            'end_date': self.today_str
         })
 
         self.assertEqual(response_short.status_code, status.HTTP_200_OK)
@@ -464,13 +613,9 @@ class ChartAPITests(TestCase):
 
     def test_admin_charts_includes_correct_data_counts(self):
         """Test that admin charts include correct data counts."""
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:admin-charts')
-
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        url = self.admin_url
 
-        data = response.data['admin_charts']
+        data = self.get_ok(self.admin_client, url)['admin_charts']
 
         # Verify success ratio data
         success_ratio = data['success_ratio']
@@ -485,17 +630,16 @@ class ChartAPITests(TestCase):
     def test_cross_verification_between_api_and_analytics_functions(self):
         """Test cross-verification between API responses and
         analytics functions."""
-        from user.serializers_dashboard import get_login_trends_data
-
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:login-trends')
+        url = self.trends_url
 
         # Get data from API
-        api_response = self.client.get(url)
+        api_response = self.user_client.get(url)
         api_data = api_response.data['login_trends']
 
-        # Get data directly from analytics function
-        analytics_data = get_login_trends_data(self.user)
+        # Get data directly from analytics function, which aggregates in
+        # one grouped query rather than loading rows per day or per user
+        with self.assertNumQueries(1):
+            analytics_data = get_login_trends_data(self.user)
 
         # Should have same structure and similar data
         self.assertEqual(len(api_data['labels']),
@@ -514,101 +658,40 @@ class ChartAPITests(TestCase):
     def test_invalid_date_parameters_return_proper_error(self):
         """Test that invalid date parameters return proper
         error messages."""
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:login-trends')
-
-        # Test various invalid date formats
-        invalid_cases = [
-            {'start_date': '2023-13-01',
-             'end_date': '2023-12-01'},  # Invalid month
-            {'start_date': '2023-01-32',
-             'end_date': '2023-12-01'},  # Invalid day
-            {'start_date': 'not-a-date',
-             'end_date': '2023-12-01'},   # Not a date
-            {'start_date': '2023/01/01',
-             'end_date': '2023-12-01'},   # Wrong format
-        ]
-
-        for params in invalid_cases:
-            response = self.client.get(url, params)
-            # Should return 400 Bad Request for invalid dates
-            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-            self.assertIn('error', response.data)
-            self.assertIn(
-                'date format',
-                response.data['error'].lower()
-            )
-
-    def test_login_comparison_with_user_ids_parameter_admin_only(self):
-        """Test login comparison endpoint with user_ids parameter."""
-        # Test with regular user - should fail
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:login-comparison')
-
-        response = self.client.get(
-            url, {'user_ids[]': [self.admin_user.id]})
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
-
-        # Test with admin user - should succeed
-        self.client.force_authenticate(user=self.admin_user)
-        response = self.client.get(
-            url, {'user_ids[]': [self.user.id, self.admin_user.id]})
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn('login_comparison', response.data)
-
-        # Should have combined comparison data structure
-        data = response.data['login_comparison']
-        self.assertIn('labels', data)
-        self.assertIn('datasets', data)
-        self.assertEqual(len(data['datasets']), 1)  # Single dataset for  # noqa: E501
-        # comparison
-
-    def test_login_distribution_with_user_ids_parameter_admin_only(self):
-        """Test login distribution endpoint with user_ids parameter (admin only)."""  # noqa: E501
-        # Test with regular user - should fail
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:login-distribution')
-
-        response = self.client.get(
-            url, {'user_ids[]': [self.admin_user.id]})
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
-
-        # Test with admin user - should succeed
-        self.client.force_authenticate(user=self.admin_user)
-        response = self.client.get(
-            url, {'user_ids[]': [self.user.id, self.admin_user.id]})
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn('login_distribution', response.data)
-
-        # Should have combined distribution data structure
-        data = response.data['login_distribution']
-        self.assertIn('success_ratio', data)
-        self.assertIn('user_agents', data)
-
-        # Verify success ratio has combined data
-        success_ratio = data['success_ratio']
-        self.assertEqual(success_ratio['labels'], ['Successful', 'Failed'])  # noqa: E501
-        dataset = success_ratio['datasets'][0]
-        total_logins = sum(dataset['data'])
-        # Should include logins from both users
-        self.assertGreater(total_logins, 0)
+        # The view rejects the dates before touching the database, so call
+        # it directly and skip the middleware stack for each case
+        factory = APIRequestFactory()
+        view = resolve(self.trends_url).func
+
+        for invalid_date in self.INVALID_DATES:
+            with self.subTest(start_date=invalid_date):
+                request = factory.get(self.trends_url, {
+                    'start_date': invalid_date,
+                    'end_date': '2023-12-01'
+                })
+                force_authenticate(request, user=self.user)
+                response = view(request)
+                # Should return 400 Bad Request for invalid dates
+                self.assertEqual(
+                    response.status_code, status.HTTP_400_BAD_REQUEST
+                )
+                self.assertIn('error', response.data)
+                self.assertIn(
+                    'date format',
+                    response.data['error'].lower()
+                )
 
     def test_chart_endpoints_accept_url_encoded_user_ids_format(self):
         """Test chart endpoints accept both user_ids[] and user_ids%5B%5D formats."""  # noqa: E501
-        self.client.force_authenticate(user=self.admin_user)
 
         # Test both formats for trends endpoint
-        trends_url = reverse('user:login-trends')
-
         # Format 1: user_ids[] (normal format)
-        response1 = self.client.get(trends_url, {'user_ids[]': [self.user.id]})  # noqa: E501
+        response1 = self.admin_client.get(self.trends_url, {'user_ids[]': [self.user.id]})  # noqa: E501
         self.assertEqual(response1.status_code, status.HTTP_200_OK)
 
         # Format 2: user_ids%5B%5D (URL encoded format) - simulate Postman behavior   # noqa: E501
         # Django's test client automatically URL-decodes, so we test the actual parsing  # noqa: E501
-        response2 = self.client.get(trends_url, data={'user_ids[]': [self.user.id]})  # noqa: E501
+        response2 = self.admin_client.get(self.trends_url, data={'user_ids[]': [self.user.id]})  # noqa: E501
         self.assertEqual(response2.status_code, status.HTTP_200_OK)
 
         # Both should return same data structure
@@ -617,15 +700,12 @@ class ChartAPITests(TestCase):
 
     def test_chart_endpoints_return_error_for_nonexistent_users(self):
         """Test that chart endpoints return error for nonexistent user IDs."""
-        self.client.force_authenticate(user=self.admin_user)
 
         # Test with trends endpoint
-        trends_url = reverse('user:login-trends')
-
         # Use a user ID that definitely doesn't exist
         nonexistent_user_id = 99999
 
-        response = self.client.get(trends_url, {'user_ids[]': [nonexistent_user_id]})  # noqa: E501
+        response = self.admin_client.get(self.trends_url, {'user_ids[]': [nonexistent_user_id]})  # noqa: E501
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('error', response.data)
         self.assertIn(
@@ -633,45 +713,16 @@ class ChartAPITests(TestCase):
             response.data['error'].lower()
         )
 
-    def test_chart_endpoints_validate_invalid_date_formats(self):
-        """Test that chart endpoints validate invalid date formats."""
-        self.client.force_authenticate(user=self.user)
-
-        trends_url = reverse('user:login-trends')
-
-        # Test various invalid date formats
-        invalid_dates = [
-            'invalid-date',
-            '2023-13-01',  # Invalid month
-            '2023-01-32',  # Invalid day
-            '2023/01/01',  # Wrong separator
-            '2023-01-01-extra',  # Extra characters
-        ]
-
-        for invalid_date in invalid_dates:
-            response = self.client.get(trends_url, {
-                'start_date': invalid_date,
-                'end_date': '2023-12-01'
-            })
-            self.assertEqual(
-                response.status_code, status.HTTP_400_BAD_REQUEST,
-                f"Expected 400 for invalid date: {invalid_date}"
-            )
-            self.assertIn('error', response.data)
-            self.assertIn('date format', response.data['error'].lower())
-
     def test_login_trends_with_role_regular_parameter_admin_only(self):
         """Test login trends endpoint with role=regular parameter."""
-        url = reverse('user:login-trends')
+        url = self.trends_url
 
         # Test with regular user - should fail
-        self.client.force_authenticate(user=self.user)
-        response = self.client.get(url, {'role': 'regular'})
+        response = self.user_client.get(url, {'role': 'regular'})
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
         # Test with admin user - should succeed
-        self.client.force_authenticate(user=self.admin_user)
-        response = self.client.get(url, {'role': 'regular'})
+        response = self.admin_client.get(url, {'role': 'regular'})
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertIn('login_trends', response.data)
@@ -683,12 +734,9 @@ class ChartAPITests(TestCase):
         self.assertEqual(len(data['datasets']), 2)  # Successful and failed
 
         # Verify data comes from regular user only (not admin)
-        successful_data = next(
-            ds for ds in data['datasets']
-            if ds['label'] == 'Successful Logins (Combined)')
-        failed_data = next(
-            ds for ds in data['datasets']
-            if ds['label'] == 'Failed Logins (Combined)')
+        by_label = {ds['label']: ds for ds in data['datasets']}
+        successful_data = by_label['Successful Logins (Combined)']
+        failed_data = by_label['Failed Logins (Combined)']
 
         # Should have data from regular user (15 successful + 5 failed)
         total_logins = sum(successful_data['data']) + sum(failed_data['data'])
@@ -1,188 +1,241 @@
 """Tests for dashboard API endpoints."""
-from django.test import TestCase
+import re
+
+from django.core.cache import cache
+from django.db import transaction
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.urls import reverse
 from rest_framework.test import APIClient
 from rest_framework import status
 from django.contrib.auth import get_user_model
 from core.models import LoginActivity
-from datetime import timedelta
+from datetime import datetime, timedelta
 from django.utils import timezone
+from user.tests.utils import LOCMEM_CACHES
 
 User = get_user_model()
 
+# Expected formats of last_login and the weekly/monthly data keys
+_LAST_LOGIN_RE = re.compile(r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$')
+_WEEK_KEY_RE = re.compile(r'^\d{4}-\d{1,2}$')
+_MONTH_KEY_RE = re.compile(r'^\d{4}-\d{2}$')
+
+# Fields every user stats / admin dashboard response has, with their types
+_USER_STATS_FIELDS = {
+    'total_logins': int,
+    'last_login': str,
+    'weekly_data': dict,
+    'monthly_data': dict,
+    'login_trend': int,
+}
+_ADMIN_DASHBOARD_FIELDS = {
+    'total_users': int,
+    'total_logins': int,
+    'login_activity': list,
+    'user_growth': dict,
+}
+
+# Error body returned for malformed start_date/end_date parameters
+_INVALID_DATE_ERR = {'error': 'Invalid date format. Use YYYY-MM-DD format.'}
+
+
+class DashboardAPIAuthRequiredTests(SimpleTestCase):
+    """Test that dashboard endpoints reject anonymous requests."""
+
+    client_class = APIClient
+
+    def test_endpoints_require_authentication(self):
+        """Test that user stats and login activity require authentication."""
+        for name in ('user:dashboard-stats', 'user:login-activity'):
+            with self.subTest(endpoint=name):
+                response = self.client.get(reverse(name))
+                self.assertEqual(
+                    response.status_code, status.HTTP_401_UNAUTHORIZED
+                )
+
 
 class DashboardAPITests(TestCase):
-    """Test cases for dashboard API endpoints."""
+    """Shared fixtures for the dashboard API test cases."""
 
-    def setUp(self):
-        """Set up test data."""
-        self.client = APIClient()
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data once for the whole class."""
         # Create regular user
-        self.user = User.objects.create_user(
+        cls.user = User.objects.create_user(
             username='testuser',
             email='test@example.com',
             password='testpass123'
         )
         # Create admin user
-        self.admin_user = User.objects.create_superuser(
+        cls.admin_user = User.objects.create_superuser(
             username='adminuser',
             email='admin@example.com',
             password='adminpass123'
         )
         # Create some login activities for testing
-        self._create_test_login_activities()
+        cls._create_test_login_activities()
+
+        # Format the request date strings once
+        now = timezone.now()
+        cls.today_str = now.strftime('%Y-%m-%d')
+        cls.days_ago_str = {
+            days: (now - timedelta(days=days)).strftime('%Y-%m-%d')
+            for days in (5, 10)
+        }
+
+        # Reverse the endpoint URLs once
+        cls.dashboard_stats_url = reverse('user:dashboard-stats')
+        cls.login_activity_url = reverse('user:login-activity')
+        cls.admin_dashboard_url = reverse('user:admin-dashboard')
+        cls.user_specific_stats_url = reverse(
+            'user:user-specific-stats', kwargs={'user_id': cls.user.id}
+        )
+        cls.user_specific_login_activity_url = reverse(
+            'user:user-specific-login-activity',
+            kwargs={'user_id': cls.user.id}
+        )
 
-    def _create_test_login_activities(self):
-        """Create test login activities for the user."""
-        # Create successful logins for the user
-        for i in range(5):
-            activity = LoginActivity.objects.create(
-                user=self.user,
+    @classmethod
+    def _create_test_login_activities(cls):
+        """Create test login activities for the user in one bulk insert."""
+        now = timezone.now()
+
+        # Successful logins for the user
+        activities = [
+            LoginActivity(
+                user=cls.user,
                 ip_address=f'192.168.1.{i+1}',
                 user_agent=f'Test Browser {i+1}',
-                success=True
+                success=True,
+                timestamp=now - timedelta(days=i)
             )
-            # Manually set timestamp since auto_now_add ignores the parameter
-            activity.timestamp = timezone.now() - timedelta(days=i)
-            activity.save()
+            for i in range(5)
+        ]
 
-        # Create some failed logins
-        for i in range(2):
-            activity = LoginActivity.objects.create(
-                user=self.user,
+        # Some failed logins
+        activities += [
+            LoginActivity(
+                user=cls.user,
                 ip_address=f'192.168.2.{i+1}',
                 user_agent=f'Test Browser {i+1}',
-                success=False
+                success=False,
+                timestamp=now - timedelta(days=i+10)
             )
-            # Manually set timestamp since auto_now_add ignores the parameter
-            activity.timestamp = timezone.now() - timedelta(days=i+10)
-            activity.save()
-
-    def test_user_stats_endpoint_requires_authentication(self):
-        """Test that user stats endpoint requires authentication."""
-        url = reverse('user:dashboard-stats')
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
-
-    def test_user_stats_endpoint_returns_correct_data(self):
-        """Test that user stats endpoint returns correct data structure."""
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:dashboard-stats')
-        response = self.client.get(url)
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn('total_logins', response.data)
-        self.assertIn('last_login', response.data)
-        self.assertIn('weekly_data', response.data)
-        self.assertIn('monthly_data', response.data)
-        self.assertIn('login_trend', response.data)
+            for i in range(2)
+        ]
 
-        # Verify data types
-        self.assertIsInstance(response.data['total_logins'], int)
-        self.assertIsInstance(response.data['last_login'], str)
-        self.assertIsInstance(response.data['weekly_data'], dict)
-        self.assertIsInstance(response.data['monthly_data'], dict)
-        self.assertIsInstance(response.data['login_trend'], int)
-
-    def test_login_activity_endpoint_requires_authentication(self):
-        """Test that login activity endpoint requires authentication."""
-        url = reverse('user:login-activity')
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        # The activities and the user statistics describing them are
+        # written together, so they can never be seen out of step
+        with transaction.atomic():
+            LoginActivity.objects.bulk_create(activities, batch_size=500)
+
+            # bulk_create skips LoginActivity.save(), so record the user
+            # statistics it would have kept for the 5 successful logins
+            week_start = now - timedelta(days=now.weekday())
+            cls.user.login_count = 5
+            cls.user.last_login_timestamp = now
+            cls.user.weekly_logins = {week_start.strftime('%Y-%U'): 5}
+            cls.user.monthly_logins = {now.strftime('%Y-%m'): 5}
+            cls.user.save(update_fields=[
+                'login_count',
+                'last_login_timestamp',
+                'weekly_logins',
+                'monthly_logins'
+            ])
+
+
+class UserAuthMixin:
+    """Authenticate the test client as the regular user before each test."""
 
-    def test_login_activity_endpoint_returns_paginated_data(self):
-        """Test that login activity endpoint returns paginated data."""
+    def setUp(self):
+        super().setUp()
         self.client.force_authenticate(user=self.user)
-        url = reverse('user:login-activity')
-        response = self.client.get(url)
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn('count', response.data)
-        self.assertIn('results', response.data)
-        self.assertIsInstance(response.data['results'], list)
-
-        # Should return all login activities for the user
-        self.assertEqual(response.data['count'], 7)  # 5 successful + 2 failed
 
-    def test_admin_dashboard_endpoint_requires_admin_permissions(self):
-        """Test that admin dashboard endpoint requires admin permissions."""
-        # Regular user should not have access
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:admin-dashboard')
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
-        # Admin user should have access
-        self.client.force_authenticate(user=self.admin_user)
-        response = self.client.get(url)
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+class AdminAuthMixin:
+    """Authenticate the test client as the admin user before each test."""
 
-    def test_admin_dashboard_returns_correct_data(self):
-        """Test admin dashboard endpoint returns correct data structure."""
+    def setUp(self):
+        super().setUp()
         self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:admin-dashboard')
-        response = self.client.get(url)
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn('total_users', response.data)
-        self.assertIn('total_logins', response.data)
-        self.assertIn('login_activity', response.data)
-        self.assertIn('user_growth', response.data)
 
-        # Verify data types
-        self.assertIsInstance(response.data['total_users'], int)
-        self.assertIsInstance(response.data['total_logins'], int)
-        self.assertIsInstance(response.data['login_activity'], list)
-        self.assertIsInstance(response.data['user_growth'], dict)
+class WithoutLoginActivitiesMixin:
+    """Skip the shared login activities, so each test creates its own."""
 
-    def test_login_activity_endpoint_supports_pagination(self):
-        """Test that login activity endpoint supports pagination."""
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:login-activity')
-        response = self.client.get(url, {'page': 1, 'size': 3})
+    @classmethod
+    def _create_test_login_activities(cls):
+        """Create no login activities."""
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data['results']), 3)
-        self.assertEqual(response.data['count'], 7)
 
-    def test_login_activity_returns_more_than_default_records(self):
-        """Test that login activity endpoint can return more than default
-        3 records."""
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:login-activity')
+class UserDashboardAPITests(UserAuthMixin, DashboardAPITests):
+    """Dashboard API tests run as the regular user."""
 
-        # Request 100 records (frontend default)
-        response = self.client.get(url, {'size': 100})
+    def test_user_stats_endpoint_returns_correct_data(self):
+        """Test that user stats endpoint returns correct data structure,
+        login counts and login trend."""
+        url = self.dashboard_stats_url
+        # Refresh the user, then count successes and failures together
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        # Should return all 7 records, not just 3
-        self.assertEqual(response.data['count'], 7)
-        self.assertEqual(len(response.data['results']), 7)
+        self.assertLessEqual(_USER_STATS_FIELDS.keys(), response.data.keys())
 
-    def test_user_stats_includes_correct_login_count(self):
-        """Test that user stats includes correct login count."""
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:dashboard-stats')
-        response = self.client.get(url)
+        # Verify data types
+        for field, field_type in _USER_STATS_FIELDS.items():
+            self.assertIsInstance(response.data[field], field_type)
 
         # Should count all login attempts (5 successful + 2 failed = 7)
         self.assertEqual(response.data['total_logins'], 7)
         self.assertEqual(response.data['total_successful_logins'], 5)
         self.assertEqual(response.data['total_failed_logins'], 2)
 
-    def test_user_stats_includes_login_trend_calculation(self):
-        """Test that user stats includes login trend calculation."""
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:dashboard-stats')
+    def test_login_activity_pagination(self):
+        """Test that login activity returns all of the user's activities,
+        paginated by the size parameter."""
+        url = self.login_activity_url
+        # (case, query params, expected page length, query budget); the
+        # count is always all 7 activities (5 successful + 2 failed)
+        cases = (
+            # A first page that is not full needs no separate COUNT query
+            ('default page size', {}, 7, 1),
+            # Page count and one page of activities
+            ('size smaller than count', {'page': 1, 'size': 3}, 3, 2),
+            # More than the user list's default of 3 (frontend default)
+            ('size larger than count', {'size': 100}, 7, 1),
+        )
+
+        for case, params, page_length, num_queries in cases:
+            with self.subTest(case=case):
+                with self.assertNumQueries(num_queries):
+                    response = self.client.get(url, params)
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertLessEqual(
+                    {'count', 'results'}, response.data.keys()
+                )
+                self.assertIsInstance(response.data['results'], list)
+                self.assertEqual(response.data['count'], 7)
+                self.assertEqual(len(response.data['results']), page_length)
+
+    def test_admin_dashboard_endpoint_requires_admin_permissions(self):
+        """Test that admin dashboard endpoint requires admin permissions."""
+        # Regular user should not have access
+        url = self.admin_dashboard_url
         response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
-        # Login trend should be calculated (could be positive or negative)
-        self.assertIsInstance(response.data['login_trend'], int)
+        # Admin user should have access
+        self.client.force_authenticate(user=self.admin_user)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
 
     def test_user_stats_last_login_format(self):
         """Test that last_login field uses correct datetime format."""
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:dashboard-stats')
+        url = self.dashboard_stats_url
         response = self.client.get(url)
 
         # Verify last_login uses YYYY-MM-DD HH:MM:SS format
@@ -190,52 +243,156 @@ class DashboardAPITests(TestCase):
         self.assertIsInstance(last_login, str)
 
         # Check format using regex pattern
-        pattern = r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$'
         error_msg = (
             f"last_login '{last_login}' doesn't match expected format "
             "YYYY-MM-DD HH:MM:SS"
         )
-        self.assertRegex(last_login, pattern, error_msg)
+        self.assertRegex(last_login, _LAST_LOGIN_RE, error_msg)
 
     def test_user_stats_data_structure(self):
         """Test that user stats returns expected data structure."""
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:dashboard-stats')
-        response = self.client.get(url)
+        url = self.dashboard_stats_url
+        data = self.client.get(url).data
 
         # Verify complete response structure
-        expected_keys = [
-            'total_logins', 'last_login', 'weekly_data',
-            'monthly_data', 'login_trend',
-            'total_successful_logins', 'total_failed_logins'
-        ]
-        self.assertEqual(set(response.data.keys()), set(expected_keys))
+        self.assertEqual(
+            data.keys(),
+            _USER_STATS_FIELDS.keys()
+            | {'total_successful_logins', 'total_failed_logins'}
+        )
 
         # Verify data types
-        self.assertIsInstance(response.data['total_logins'], int)
-        self.assertIsInstance(response.data['last_login'], str)
-        self.assertIsInstance(response.data['weekly_data'], dict)
-        self.assertIsInstance(response.data['monthly_data'], dict)
-        self.assertIsInstance(response.data['login_trend'], int)
+        for field, field_type in _USER_STATS_FIELDS.items():
+            self.assertIsInstance(data[field], field_type)
 
         # Verify weekly_data format (YYYY-WW format like "2025-50")
-        for key in response.data['weekly_data'].keys():
+        for key in data['weekly_data'].keys():
             self.assertRegex(
-                key, r'^\d{4}-\d{1,2}$',
+                key, _WEEK_KEY_RE,
                 f"Weekly data key '{key}' doesn't match YYYY-WW format"
             )
         # Verify monthly_data format (YYYY-MM format like "2025-12")
-        for key in response.data['monthly_data'].keys():
+        for key in data['monthly_data'].keys():
             self.assertRegex(
-                key, r'^\d{4}-\d{2}$',
+                key, _MONTH_KEY_RE,
                 f"Monthly data key '{key}' doesn't match YYYY-MM format"
             )
 
+    def test_user_stats_example_data_format(self):
+        """Test that user stats matches the expected example format."""
+        url = self.dashboard_stats_url
+        response = self.client.get(url)
+
+        # Verify all expected fields are present with correct types
+        self.assertLessEqual(_USER_STATS_FIELDS.keys(), response.data.keys())
+
+        # Verify last_login format specifically
+        last_login = response.data['last_login']
+        self.assertRegex(last_login, _LAST_LOGIN_RE)
+
+    # Date filtering tests for USER_STATS endpoint
+    def test_user_stats_accepts_date_parameters(self):
+        """Test user stats endpoint accepts start_date and end_date parameters."""  # noqa: E501
+        url = self.dashboard_stats_url
+
+        start_date = self.days_ago_str[10]
+        end_date = self.today_str
+
+        response = self.client.get(
+            url,
+            {
+                'start_date': start_date,
+                'end_date': end_date,
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('total_logins', response.data)
+
+    def test_user_stats_invalid_date_format_returns_400(self):
+        """Test that invalid date format returns 400 error with exact message."""  # noqa: E501
+        url = self.dashboard_stats_url
+
+        response = self.client.get(url, {'start_date': 'invalid-date', 'end_date': '2025-12-31'})  # noqa: E501
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, _INVALID_DATE_ERR)
+
+    def test_user_stats_rejects_dates_not_in_yyyy_mm_dd_format(self):
+        """Test that only real YYYY-MM-DD dates are accepted."""
+        url = self.dashboard_stats_url
+        for value in ('2025-1-5', '20250105', '2025-01-05T00:00',
+                      '2025-02-30', '2025-13-01', ' 2025-01-05'):
+            with self.subTest(start_date=value):
+                response = self.client.get(
+                    url, {'start_date': value, 'end_date': '2025-12-31'}
+                )
+
+                self.assertEqual(
+                    response.status_code, status.HTTP_400_BAD_REQUEST
+                )
+                self.assertEqual(response.data, _INVALID_DATE_ERR)
+
+    def test_user_stats_no_date_parameters_uses_default_behavior(self):
+        """Test that without date parameters, endpoint uses default behavior from User model."""  # noqa: E501
+        url = self.dashboard_stats_url
+
+        # Get response without date parameters (should use User model stats)
+        response = self.client.get(url)
+
+        # Should return successful response with expected structure
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertLessEqual(_USER_STATS_FIELDS.keys(), response.data.keys())
+
+        # Should have some login count from setUp activities
+        self.assertGreaterEqual(response.data['total_logins'], 0)
+
+    def test_login_activity_invalid_date_format_returns_400(self):
+        """Test that invalid date format in login activity returns 400 error with exact message."""  # noqa: E501
+        url = self.login_activity_url
+
+        response = self.client.get(url, {'start_date': 'not-a-date', 'end_date': '2025-12-31'})  # noqa: E501
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, _INVALID_DATE_ERR)
+
+    # TDD: Tests for total_successful_logins and total_failed_logins
+    def test_user_stats_includes_successful_and_failed_logins(self):
+        """Test that user stats includes total_successful_logins and
+        total_failed_logins."""
+        url = self.dashboard_stats_url
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn('total_successful_logins', response.data)
+        self.assertIn('total_failed_logins', response.data)
+        self.assertIsInstance(response.data['total_successful_logins'], int)
+        self.assertIsInstance(response.data['total_failed_logins'], int)
+
+    def test_user_stats_data_structure_includes_new_fields(self):
+        """Test that user stats response includes the new fields in data
+        structure."""
+        url = self.dashboard_stats_url
+        response = self.client.get(url)
+
+        self.assertEqual(
+            response.data.keys(),
+            _USER_STATS_FIELDS.keys()
+            | {'total_successful_logins', 'total_failed_logins'}
+        )
+
+
+class DashboardDateFilterTests(
+    UserAuthMixin, WithoutLoginActivitiesMixin, DashboardAPITests
+):
+    """Dashboard API tests that create their own login activities.
+
+    The user starts without login activities, so each test only inserts
+    the rows it filters on instead of deleting the shared fixtures first.
+    """
+
     def test_user_stats_last_login_accuracy(self):
         """Test that last_login shows the correct actual timestamp."""
-        # Clear existing login activities for this user
-        LoginActivity.objects.filter(user=self.user).delete()
-
         # Create a login activity with current timestamp
         login_activity = LoginActivity.objects.create(
             user=self.user,
@@ -249,15 +406,13 @@ class DashboardAPITests(TestCase):
         # Refresh user to get updated stats
         self.user.refresh_from_db()
 
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:dashboard-stats')
+        url = self.dashboard_stats_url
         response = self.client.get(url)
 
         # Verify the last_login matches our actual timestamp
         last_login_str = response.data['last_login']
-        from datetime import datetime
         last_login_dt = timezone.make_aware(
-            datetime.strptime(last_login_str, '%Y-%m-%d %H:%M:%S')
+            datetime.fromisoformat(last_login_str)
         )
 
         # Allow for small time differences due to processing
@@ -266,87 +421,38 @@ class DashboardAPITests(TestCase):
         )
         self.assertLessEqual(time_difference, 5)
 
-    def test_user_stats_example_data_format(self):
-        """Test that user stats matches the expected example format."""
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:dashboard-stats')
-        response = self.client.get(url)
-
-        # Verify all expected fields are present with correct types
-        self.assertIn('total_logins', response.data)
-        self.assertIn('last_login', response.data)
-        self.assertIn('weekly_data', response.data)
-        self.assertIn('monthly_data', response.data)
-        self.assertIn('login_trend', response.data)
-
-        # Verify last_login format specifically
-        last_login = response.data['last_login']
-        self.assertRegex(last_login, r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$')
-
-    def test_admin_dashboard_includes_user_growth_data(self):
-        """Test that admin dashboard includes user growth data."""
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:admin-dashboard')
-        response = self.client.get(url)
-
-        # Should include user growth data by month
-        self.assertIsInstance(response.data['user_growth'], dict)
-        self.assertTrue(len(response.data['user_growth']) > 0)
-
-    # Date filtering tests for USER_STATS endpoint
-    def test_user_stats_accepts_date_parameters(self):
-        """Test user stats endpoint accepts start_date and end_date parameters."""  # noqa: E501
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:dashboard-stats')
-
-        start_date = (timezone.now() - timedelta(days=10)).strftime('%Y-%m-%d')
-        end_date = timezone.now().strftime('%Y-%m-%d')
-
-        response = self.client.get(
-            url,
-            {
-                'start_date': start_date,
-                'end_date': end_date,
-            },
-        )
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn('total_logins', response.data)
-
     def test_user_stats_date_filtering_works(self):
         """Test that user stats correctly filters data by date range."""
-        # Clear existing activities
-        LoginActivity.objects.filter(user=self.user).delete()
-
         # Create activities in specific date ranges
         base_time = timezone.now()
 
-        # Activities within date range (should be counted)
-        for i in range(3):
-            activity = LoginActivity.objects.create(
-                user=self.user,
-                ip_address=f'192.168.1.{i+1}',
-                user_agent=f'Browser {i+1}',
-                success=True
-            )
-            # Manually set timestamp since auto_now_add ignores the parameter
-            activity.timestamp = base_time - timedelta(days=i+1)
-            activity.save()
-
-        # Activities outside date range (should not be counted)
-        for i in range(2):
-            activity = LoginActivity.objects.create(
-                user=self.user,
-                ip_address=f'192.168.2.{i+1}',
-                user_agent=f'Browser {i+1}',
-                success=True
-            )
-            # Manually set timestamp since auto_now_add ignores the parameter
-            activity.timestamp = base_time - timedelta(days=i+10)
-            activity.save()
+        # The timestamp default is only applied when none is given, so each
+        # row is inserted with its final timestamp in one bulk INSERT
+        LoginActivity.objects.bulk_create(
+            # Activities within date range (should be counted)
+            [
+                LoginActivity(
+                    user=self.user,
+                    ip_address=f'192.168.1.{i+1}',
+                    user_agent=f'Browser {i+1}',
+                    success=True,
+                    timestamp=base_time - timedelta(days=i+1)
+                )
+                for i in range(3)
+            ]
+            # One outlier far outside the date range (should not be counted)
+            + [
+                LoginActivity(
+                    user=self.user,
+                    ip_address='10.0.0.1',
+                    user_agent='Outlier',
+                    success=True,
+                    timestamp=base_time - timedelta(days=365)
+                )
+            ]
+        )
 
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:dashboard-stats')
+        url = self.dashboard_stats_url
 
         # Date range: 5 days ago to now
         start_date = (base_time - timedelta(days=5)).strftime('%Y-%m-%d')
@@ -358,70 +464,92 @@ class DashboardAPITests(TestCase):
         # Should count only the 3 activities within the date range
         self.assertEqual(response.data['total_logins'], 3)
 
-    def test_user_stats_invalid_date_format_returns_400(self):
-        """Test that invalid date format returns 400 error with exact message."""  # noqa: E501
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:dashboard-stats')
-
-        response = self.client.get(url, {'start_date': 'invalid-date', 'end_date': '2025-12-31'})  # noqa: E501
-
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertEqual(response.data, {'error': 'Invalid date format. Use YYYY-MM-DD format.'})  # noqa: E501
+    def test_user_stats_date_filtering_groups_weeks_and_months(self):
+        """Test that filtered user stats bucket successful logins by
+        Sunday-based week and by month in grouped queries."""
+        # Friday, Saturday, and twice on Sunday, which starts a new week
+        timestamps = [
+            timezone.make_aware(datetime(2025, 2, 28, 12)),
+            timezone.make_aware(datetime(2025, 3, 1, 12)),
+            timezone.make_aware(datetime(2025, 3, 2, 12)),
+            timezone.make_aware(datetime(2025, 3, 2, 13)),
+        ]
+        LoginActivity.objects.bulk_create(
+            [
+                LoginActivity(
+                    user=self.user,
+                    ip_address='192.168.1.1',
+                    user_agent='Browser',
+                    success=True,
+                    timestamp=timestamp
+                )
+                for timestamp in timestamps
+            ]
+            # Failed logins are left out of the buckets
+            + [
+                LoginActivity(
+                    user=self.user,
+                    ip_address='192.168.1.2',
+                    user_agent='Browser',
+                    success=False,
+                    timestamp=timestamps[-1]
+                )
+            ]
+        )
 
-    def test_user_stats_no_date_parameters_uses_default_behavior(self):
-        """Test that without date parameters, endpoint uses default behavior from User model."""  # noqa: E501
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:dashboard-stats')
+        url = self.dashboard_stats_url
+        params = {'start_date': '2025-02-27', 'end_date': '2025-03-03'}
 
-        # Get response without date parameters (should use User model stats)
-        response = self.client.get(url)
+        # Count successes and failures, group successful logins by day,
+        # then count each half of the range for the trend
+        with self.assertNumQueries(4):
+            response = self.client.get(url, params)
 
-        # Should return successful response with expected structure
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn('total_logins', response.data)
-        self.assertIn('last_login', response.data)
-        self.assertIn('weekly_data', response.data)
-        self.assertIn('monthly_data', response.data)
-        self.assertIn('login_trend', response.data)
-
-        # Should have some login count from setUp activities
-        self.assertGreaterEqual(response.data['total_logins'], 0)
+        self.assertEqual(
+            response.data['weekly_data'], {'2025-08': 2, '2025-09': 2}
+        )
+        self.assertEqual(
+            response.data['monthly_data'], {'2025-02': 1, '2025-03': 3}
+        )
+        self.assertEqual(
+            response.data['last_login'],
+            timezone.localtime(timestamps[-1]).strftime('%Y-%m-%d %H:%M:%S')
+        )
+        # One login in the first half of the range, three in the second
+        self.assertEqual(response.data['login_trend'], 200)
 
     # Date filtering tests for LOGIN_ACTIVITY endpoint
     def test_login_activity_date_filtering_works(self):
         """Test that login activity endpoint correctly filters by date range."""  # noqa: E501
-        # Clear existing activities
-        LoginActivity.objects.filter(user=self.user).delete()
-
         base_time = timezone.now()
 
-        # Create activities in different date ranges
-        # Within date range
-        for i in range(3):
-            activity = LoginActivity.objects.create(
-                user=self.user,
-                ip_address=f'192.168.1.{i+1}',
-                user_agent=f'Browser {i+1}',
-                success=True
-            )
-            # Manually set timestamp since auto_now_add ignores the parameter
-            activity.timestamp = base_time - timedelta(days=i+1)
-            activity.save()
-
-        # Outside date range
-        for i in range(2):
-            activity = LoginActivity.objects.create(
-                user=self.user,
-                ip_address=f'192.168.2.{i+1}',
-                user_agent=f'Browser {i+1}',
-                success=False
-            )
-            # Manually set timestamp since auto_now_add ignores the parameter
-            activity.timestamp = base_time - timedelta(days=i+10)
-            activity.save()
+        # Create activities in different date ranges in one bulk INSERT
+        LoginActivity.objects.bulk_create(
+            # Within date range
+            [
+                LoginActivity(
+                    user=self.user,
+                    ip_address=f'192.168.1.{i+1}',
+                    user_agent=f'Browser {i+1}',
+                    success=True,
+                    timestamp=base_time - timedelta(days=i+1)
+                )
+                for i in range(3)
+            ]
+            # One outlier far outside the date range (should not be counted)
+            + [
+                LoginActivity(
+                    user=self.user,
+                    ip_address='10.0.0.1',
+                    user_agent='Outlier',
+                    success=False,
+                    timestamp=base_time - timedelta(days=365)
+                )
+            ]
+        )
 
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:login-activity')
+        url = self.login_activity_url
 
         # Date range: 5 days ago to now
         start_date = (base_time - timedelta(days=5)).strftime('%Y-%m-%d')
@@ -433,50 +561,23 @@ class DashboardAPITests(TestCase):
         # Should return only 3 activities within the date range
         self.assertEqual(response.data['count'], 3)
 
-    def test_login_activity_invalid_date_format_returns_400(self):
-        """Test that invalid date format in login activity returns 400 error with exact message."""  # noqa: E501
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:login-activity')
+    def test_login_activity_date_filtering_with_pagination(self):
+        """Test that date filtering works correctly with pagination."""
+        base_time = timezone.now()
 
-        response = self.client.get(url, {'start_date': 'not-a-date', 'end_date': '2025-12-31'})  # noqa: E501
+        # Create many activities within date range in one bulk INSERT
+        LoginActivity.objects.bulk_create([
+            LoginActivity(
+                user=self.user,
+                ip_address=f'192.168.1.{i+1}',
+                user_agent=f'Browser {i+1}',
+                success=True,
+                timestamp=base_time - timedelta(days=i+1)
+            )
+            for i in range(10)
+        ])
 
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertEqual(response.data, {'error': 'Invalid date format. Use YYYY-MM-DD format.'})  # noqa: E501
-
-    def test_login_activity_no_date_parameters_returns_all(self):
-        """Test that without date parameters, login activity returns all activities."""  # noqa: E501
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:login-activity')
-
-        # Get total count of activities for this user
-        total_activities = LoginActivity.objects.filter(user=self.user).count()
-
-        response = self.client.get(url)
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['count'], total_activities)
-
-    def test_login_activity_date_filtering_with_pagination(self):
-        """Test that date filtering works correctly with pagination."""
-        # Clear existing activities
-        LoginActivity.objects.filter(user=self.user).delete()
-
-        base_time = timezone.now()
-
-        # Create many activities within date range
-        for i in range(10):
-            activity = LoginActivity.objects.create(
-                user=self.user,
-                ip_address=f'192.168.1.{i+1}',
-                user_agent=f'Browser {i+1}',
-                success=True
-            )
-            # Manually set timestamp since auto_now_add ignores the parameter
-            activity.timestamp = base_time - timedelta(days=i+1)
-            activity.save()
-
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:login-activity')
+        url = self.login_activity_url
 
         # Date range that includes all activities
         start_date = (base_time - timedelta(days=15)).strftime('%Y-%m-%d')
@@ -493,80 +594,118 @@ class DashboardAPITests(TestCase):
         self.assertEqual(len(response.data['results']), 5)
         self.assertEqual(response.data['count'], 10)
 
-    def test_admin_dashboard_me_parameter_shows_current_user_data(self):
-        """Test that me=true parameter shows only current admin user's data in dashboard format."""  # noqa: E501
-        # Create additional users and login activities to ensure filtering works  # noqa: E501
-        other_admin = User.objects.create_superuser(
-            username='otheradmin',
-            email='otheradmin@example.com',
-            password='adminpass123'
-        )
-
-        # Create login activities for the other admin
-        for i in range(3):
-            activity = LoginActivity.objects.create(
-                user=other_admin,
-                ip_address=f'192.168.3.{i+1}',
-                user_agent=f'Other Admin Browser {i+1}',
+    def test_user_stats_successful_and_failed_counts_are_accurate(self):
+        """Test that successful and failed login counts match actual
+        LoginActivity records."""
+        # Create exactly 3 successful and 2 failed logins
+        LoginActivity.objects.bulk_create([
+            LoginActivity(
+                user=self.user,
+                ip_address=f'192.168.1.{i+1}',
+                user_agent=f'Success Browser {i+1}',
                 success=True
             )
-            activity.timestamp = timezone.now() - timedelta(days=i)
-            activity.save()
-
-        # Create login activities for the current admin user
-        for i in range(2):
-            activity = LoginActivity.objects.create(
-                user=self.admin_user,
-                ip_address=f'192.168.4.{i+1}',
-                user_agent=f'Current Admin Browser {i+1}',
-                success=True
+            for i in range(3)
+        ])
+        LoginActivity.objects.bulk_create([
+            LoginActivity(
+                user=self.user,
+                ip_address=f'192.168.2.{i+1}',
+                user_agent=f'Fail Browser {i+1}',
+                success=False
             )
-            activity.timestamp = timezone.now() - timedelta(days=i)
-            activity.save()
-
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:admin-dashboard')
+            for i in range(2)
+        ])
 
-        # Get dashboard with me=true
-        response = self.client.get(url, {'me': 'true'})
+        url = self.dashboard_stats_url
+        response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total_successful_logins'], 3)
+        self.assertEqual(response.data['total_failed_logins'], 2)
+        # total_logins should be sum of successful + failed
+        self.assertEqual(response.data['total_logins'], 5)
 
-        # Should show data for only the current admin user
-        # total_users should be 1 (only current admin)
-        self.assertEqual(response.data['total_users'], 1)
+    # TDD: Tests for end-of-day inclusion bug
+    # (date filter should include full day)
+    def test_user_stats_includes_logins_on_last_day_of_range(self):
+        """Test that user stats includes logins occurring on the last day
+        of the date range, even if they are after midnight.
 
-        # total_logins should be only current admin's logins (2)
-        self.assertEqual(response.data['total_logins'], 2)
+        Regression test: the old code parsed end_date as
+        YYYY-MM-DD 00:00:00, which excluded any login after midnight
+        on the last day.
+        """
+        # Create a login at 3:00 PM today (after midnight)
+        today_3pm = timezone.now().replace(
+            hour=15, minute=0, second=0, microsecond=0
+        )
+        LoginActivity.objects.create(
+            user=self.user,
+            ip_address='192.168.1.100',
+            user_agent='Test Browser',
+            success=True,
+            timestamp=today_3pm
+        )
 
-        # login_activity should only show current admin's activities
-        self.assertIsInstance(response.data['login_activity'], list)
-        for activity in response.data['login_activity']:
-            self.assertEqual(activity['username'], self.admin_user.username)
+        url = self.dashboard_stats_url
 
-    def test_admin_dashboard_me_parameter_takes_precedence_over_role(self):
-        """Test that me=true parameter takes precedence over role parameter."""
-        # Create additional users (intentionally unused for this test)
-        other_admin = User.objects.create_superuser(  # noqa: F841
-            username='otheradmin2',
-            email='otheradmin2@example.com',
-            password='adminpass123'
-        )
-        regular_user = User.objects.create_user(  # noqa: F841
-            username='regularuser2',
-            email='regularuser2@example.com',
-            password='userpass123'
+        # Query with today as both start and end date
+        today_str = today_3pm.strftime('%Y-%m-%d')
+
+        response = self.client.get(url, {
+            'start_date': today_str,
+            'end_date': today_str,
+        })
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # The login at 3 PM today MUST be included
+        self.assertEqual(
+            response.data['total_logins'],
+            1,
+            "Login at 3:00 PM on last day should be included in range"
         )
 
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:admin-dashboard')
 
-        # Use both me=true and role=regular - me should take precedence
-        response = self.client.get(url, {'me': 'true', 'role': 'regular'})
+class AdminDashboardAPITests(AdminAuthMixin, DashboardAPITests):
+    """Dashboard API tests run as the admin user."""
+
+    def test_admin_dashboard_returns_correct_data(self):
+        """Test admin dashboard endpoint returns correct data structure."""
+        url = self.admin_dashboard_url
+        # ETag data version (2), user count, login counts, recent
+        # activity and the user list
+        with self.assertNumQueries(6):
+            response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        # Should show only current admin user's data, not regular users
-        self.assertEqual(response.data['total_users'], 1)
+        self.assertLessEqual(
+            _ADMIN_DASHBOARD_FIELDS.keys(), response.data.keys()
+        )
+
+        # Verify data types
+        for field, field_type in _ADMIN_DASHBOARD_FIELDS.items():
+            self.assertIsInstance(response.data[field], field_type)
+
+    def test_admin_dashboard_login_activity_matches_login_activity_list(self):
+        """Test that recent activity on the admin dashboard is formatted
+        exactly like the login activity list."""
+        dashboard = self.client.get(self.admin_dashboard_url)
+        activities = self.client.get(self.user_specific_login_activity_url)
+
+        # Only the regular user has logins, so both list all 7 of them
+        self.assertEqual(
+            dashboard.data['login_activity'], activities.data['results']
+        )
+
+    def test_admin_dashboard_includes_user_growth_data(self):
+        """Test that admin dashboard includes user growth data."""
+        url = self.admin_dashboard_url
+        response = self.client.get(url)
+
+        # Should include user growth data by month
+        self.assertIsInstance(response.data['user_growth'], dict)
+        self.assertTrue(len(response.data['user_growth']) > 0)
 
     # Phase 1: Parameter Acceptance & Validation
     # Test Cycle 1.1: user_ids[] parameter
@@ -584,32 +723,34 @@ class DashboardAPITests(TestCase):
             password='testpass123'
         )
 
+        now = timezone.now()
+
         # Create login activities for user2
-        for i in range(3):
-            activity = LoginActivity.objects.create(
+        LoginActivity.objects.bulk_create([
+            LoginActivity(
                 user=user2,
                 ip_address=f'192.168.5.{i+1}',
                 user_agent=f'User2 Browser {i+1}',
-                success=True
+                success=True,
+                timestamp=now - timedelta(days=i)
             )
-            activity.timestamp = timezone.now() - timedelta(days=i)
-            activity.save()
+            for i in range(3)
+        ])
 
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:admin-dashboard')
+        url = self.admin_dashboard_url
 
         # Test with user_ids[] parameter
         response = self.client.get(url, {'user_ids[]': [user2.id, user3.id]})
 
         # Should return 200 and filter data
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn('total_users', response.data)
-        self.assertIn('total_logins', response.data)
+        self.assertLessEqual(
+            _ADMIN_DASHBOARD_FIELDS.keys(), response.data.keys()
+        )
 
     def test_admin_dashboard_validates_user_ids_format(self):
         """Test that admin dashboard validates user_ids[] format."""
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:admin-dashboard')
+        url = self.admin_dashboard_url
 
         # Test with invalid user_ids format
         response = self.client.get(url, {'user_ids[]': ['invalid']})
@@ -623,53 +764,48 @@ class DashboardAPITests(TestCase):
         Test that admin dashboard endpoint accepts start_date
         and end_date parameters.
         """
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:admin-dashboard')
+        url = self.admin_dashboard_url
 
-        start_date = (timezone.now() - timedelta(days=10)).strftime('%Y-%m-%d')
-        end_date = timezone.now().strftime('%Y-%m-%d')
+        start_date = self.days_ago_str[10]
+        end_date = self.today_str
 
         response = self.client.get(
             url, {'start_date': start_date, 'end_date': end_date})
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn('total_users', response.data)
-        self.assertIn('total_logins', response.data)
+        self.assertLessEqual(
+            _ADMIN_DASHBOARD_FIELDS.keys(), response.data.keys()
+        )
 
     def test_admin_dashboard_validates_date_format(self):
         """Test that admin dashboard validates date format."""
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:admin-dashboard')
+        url = self.admin_dashboard_url
 
         response = self.client.get(
             url, {'start_date': 'invalid-date', 'end_date': '2025-12-31'})
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertEqual(
-            response.data, {'error':
-                            'Invalid date format. Use YYYY-MM-DD format.'})
+        self.assertEqual(response.data, _INVALID_DATE_ERR)
 
     def test_admin_dashboard_handles_partial_date_range(self):
         """Test that admin dashboard handles partial date ranges
         (only start or only end)."""
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:admin-dashboard')
+        url = self.admin_dashboard_url
 
         # Test with only start_date
-        start_date = (timezone.now() - timedelta(days=5)).strftime('%Y-%m-%d')
+        start_date = self.days_ago_str[5]
         response = self.client.get(url, {'start_date': start_date})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         # Test with only end_date
-        end_date = timezone.now().strftime('%Y-%m-%d')
+        end_date = self.today_str
         response = self.client.get(url, {'end_date': end_date})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
     # Test Cycle 1.3: filter parameter
     def test_admin_dashboard_accepts_filter_parameter(self):
         """Test that admin dashboard endpoint accepts filter parameter."""
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:admin-dashboard')
+        url = self.admin_dashboard_url
 
         # Test with valid filter values
         for filter_value in [
@@ -683,8 +819,7 @@ class DashboardAPITests(TestCase):
 
     def test_admin_dashboard_validates_filter_values(self):
         """Test that admin dashboard validates filter parameter values."""
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:admin-dashboard')
+        url = self.admin_dashboard_url
 
         # Test with invalid filter value
         response = self.client.get(url, {'filter': 'invalid_filter'})
@@ -706,29 +841,30 @@ class DashboardAPITests(TestCase):
             password='testpass123'
         )
 
+        now = timezone.now()
+
         # Create login activities for user2 (3 activities)
-        for i in range(3):
-            activity = LoginActivity.objects.create(
+        LoginActivity.objects.bulk_create([
+            LoginActivity(
                 user=user2,
                 ip_address=f'192.168.5.{i+1}',
                 user_agent=f'User2 Browser {i+1}',
-                success=True
+                success=True,
+                timestamp=now - timedelta(days=i)
             )
-            activity.timestamp = timezone.now() - timedelta(days=i)
-            activity.save()
+            for i in range(3)
+        ])
 
         # Create login activities for user3 (1 activity)
-        activity = LoginActivity.objects.create(
+        LoginActivity.objects.create(
             user=user3,
             ip_address='192.168.6.1',
             user_agent='User3 Browser',
-            success=True
+            success=True,
+            timestamp=now - timedelta(days=1)
         )
-        activity.timestamp = timezone.now() - timedelta(days=1)
-        activity.save()
 
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:admin-dashboard')
+        url = self.admin_dashboard_url
 
         # Test filtering by user2 and user3 only
         response = self.client.get(url, {'user_ids[]': [user2.id, user3.id]})
@@ -745,8 +881,7 @@ class DashboardAPITests(TestCase):
 
     def test_admin_dashboard_empty_user_ids_returns_no_data(self):
         """Test that empty user_ids array returns no user data."""
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:admin-dashboard')
+        url = self.admin_dashboard_url
 
         # Test with empty user_ids array - currently falls back to all users
         # TODO: Fix Django test client handling of empty arrays
@@ -777,19 +912,21 @@ class DashboardAPITests(TestCase):
             password='testpass123'
         )
 
+        now = timezone.now()
+
         # Create login activities for both
-        for user in [admin_user, regular_user]:
-            activity = LoginActivity.objects.create(
+        LoginActivity.objects.bulk_create([
+            LoginActivity(
                 user=user,
                 ip_address='192.168.7.1',
                 user_agent='Test Browser',
-                success=True
+                success=True,
+                timestamp=now - timedelta(days=1)
             )
-            activity.timestamp = timezone.now() - timedelta(days=1)
-            activity.save()
+            for user in (admin_user, regular_user)
+        ])
 
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:admin-dashboard')
+        url = self.admin_dashboard_url
 
         # Test with both role=admin and user_ids=[regular_user.id]
         # user_ids should take precedence
@@ -805,166 +942,6 @@ class DashboardAPITests(TestCase):
         self.assertEqual(response.data['total_logins'], 1)
 
     # Test Cycle 2.2: Date range filtering
-    def test_admin_dashboard_date_range_filters_login_activities(self):
-        """
-        Test that date ranges correctly filter
-        login activities and counts.
-        """
-        # Clear existing activities
-        LoginActivity.objects.filter(user=self.user).delete()
-
-        base_time = timezone.now()
-
-        # Create activities in different date ranges
-        # Within date range (should be counted)
-        for i in range(3):
-            activity = LoginActivity.objects.create(
-                user=self.user,
-                ip_address=f'192.168.1.{i+1}',
-                user_agent=f'Browser {i+1}',
-                success=True
-            )
-            activity.timestamp = base_time - \
-                timedelta(days=i+1)  # 1-3 days ago
-            activity.save()
-
-        # Outside date range (should not be counted)
-        for i in range(2):
-            activity = LoginActivity.objects.create(
-                user=self.user,
-                ip_address=f'192.168.2.{i+1}',
-                user_agent=f'Browser {i+1}',
-                success=True
-            )
-            activity.timestamp = base_time - \
-                timedelta(days=i+10)  # 10-11 days ago
-            activity.save()
-
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:admin-dashboard')
-
-        # Date range: 5 days ago to now (should include 3 activities)
-        start_date = (base_time - timedelta(days=5)).strftime('%Y-%m-%d')
-        end_date = base_time.strftime('%Y-%m-%d')
-
-        response = self.client.get(
-            url, {'start_date': start_date, 'end_date': end_date})
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        # Should show 3 total logins within the date range
-        self.assertEqual(response.data['total_logins'], 3)
-        # Should show only 3 activities in the login_activity list
-        self.assertEqual(len(response.data['login_activity']), 3)
-
-    def test_admin_dashboard_partial_date_ranges_work(self):
-        """
-        Test that partial date ranges (start only, end only)
-        work correctly.
-        """
-        # Clear existing activities
-        LoginActivity.objects.filter(user=self.user).delete()
-
-        base_time = timezone.now()
-
-        # Create activities at different times
-        activities = []
-        for i in range(5):
-            activity = LoginActivity.objects.create(
-                user=self.user,
-                ip_address=f'192.168.1.{i+1}',
-                user_agent=f'Browser {i+1}',
-                success=True
-            )
-            activity.timestamp = base_time - \
-                timedelta(days=i*2)  # 0, 2, 4, 6, 8 days ago
-            activity.save()
-            activities.append(activity)
-
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:admin-dashboard')
-
-        # Test start_date only (from 5 days ago onwards)
-        start_date = (base_time - timedelta(days=5)).strftime('%Y-%m-%d')
-        response = self.client.get(url, {'start_date': start_date})
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        # Should include activities from 0, 2, 4 days ago (3 activities)
-        self.assertEqual(response.data['total_logins'], 3)
-
-        # Test end_date only (up to 3 days ago)
-        end_date = (base_time - timedelta(days=3)).strftime('%Y-%m-%d')
-        response = self.client.get(url, {'end_date': end_date})
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        # Should include activities from 4, 6, 8 days ago (3 activities)
-        self.assertEqual(response.data['total_logins'], 3)
-
-    def test_admin_dashboard_date_filtering_with_user_filtering(self):
-        """Test that date filtering works correctly with user filtering."""
-        # Create additional user
-        other_user = User.objects.create_user(
-            username='otheruser',
-            email='other@example.com',
-            password='testpass123'
-        )
-
-        # Clear existing activities
-        LoginActivity.objects.filter(user__in=[self.user, other_user]).delete()
-
-        base_time = timezone.now()
-
-        # Create activities for both users
-        # User 1: 3 activities within date range
-        for i in range(3):
-            activity = LoginActivity.objects.create(
-                user=self.user,
-                ip_address=f'192.168.1.{i+1}',
-                user_agent=f'Browser {i+1}',
-                success=True
-            )
-            activity.timestamp = base_time - timedelta(days=i+1)
-            activity.save()
-
-        # User 2: 2 activities within date range
-        for i in range(2):
-            activity = LoginActivity.objects.create(
-                user=other_user,
-                ip_address=f'192.168.2.{i+1}',
-                user_agent=f'Browser {i+1}',
-                success=True
-            )
-            activity.timestamp = base_time - timedelta(days=i+1)
-            activity.save()
-
-        # User 2: 1 activity outside date range
-        activity = LoginActivity.objects.create(
-            user=other_user,
-            ip_address='192.168.2.99',
-            user_agent='Browser Outside',
-            success=True
-        )
-        activity.timestamp = base_time - timedelta(days=10)
-        activity.save()
-
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:admin-dashboard')
-
-        # Filter by user_ids and date range
-        start_date = (base_time - timedelta(days=5)).strftime('%Y-%m-%d')
-        end_date = base_time.strftime('%Y-%m-%d')
-
-        response = self.client.get(url, {
-            'user_ids[]': [other_user.id],
-            'start_date': start_date,
-            'end_date': end_date
-        })
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        # Should show only other_user
-        self.assertEqual(response.data['total_users'], 1)
-        # Should show only 2 logins (within date range for other_user)
-        self.assertEqual(response.data['total_logins'], 2)
-
     # Test Cycle 2.3: Filter type logic
     def test_admin_dashboard_filter_admin_only(self):
         """
@@ -983,46 +960,46 @@ class DashboardAPITests(TestCase):
             password='userpass123'
         )
 
-        # Clear existing activities
-        LoginActivity.objects.filter(
-            user__in=[self.admin_user, admin_user2, regular_user]).delete()
+        now = timezone.now()
 
         # Create activities for each user type
         # Admin user 1: 2 activities
-        for i in range(2):
-            activity = LoginActivity.objects.create(
+        LoginActivity.objects.bulk_create([
+            LoginActivity(
                 user=self.admin_user,
                 ip_address=f'192.168.1.{i+1}',
                 user_agent=f'Admin1 Browser {i+1}',
-                success=True
+                success=True,
+                timestamp=now - timedelta(days=i)
             )
-            activity.timestamp = timezone.now() - timedelta(days=i)
-            activity.save()
+            for i in range(2)
+        ])
 
         # Admin user 2: 3 activities
-        for i in range(3):
-            activity = LoginActivity.objects.create(
+        LoginActivity.objects.bulk_create([
+            LoginActivity(
                 user=admin_user2,
                 ip_address=f'192.168.2.{i+1}',
                 user_agent=f'Admin2 Browser {i+1}',
-                success=True
+                success=True,
+                timestamp=now - timedelta(days=i)
             )
-            activity.timestamp = timezone.now() - timedelta(days=i)
-            activity.save()
+            for i in range(3)
+        ])
 
         # Regular user: 4 activities
-        for i in range(4):
-            activity = LoginActivity.objects.create(
+        LoginActivity.objects.bulk_create([
+            LoginActivity(
                 user=regular_user,
                 ip_address=f'192.168.3.{i+1}',
                 user_agent=f'Regular Browser {i+1}',
-                success=True
+                success=True,
+                timestamp=now - timedelta(days=i)
             )
-            activity.timestamp = timezone.now() - timedelta(days=i)
-            activity.save()
+            for i in range(4)
+        ])
 
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:admin-dashboard')
+        url = self.admin_dashboard_url
 
         # Test filter=admin_only
         response = self.client.get(url, {'filter': 'admin_only'})
@@ -1055,36 +1032,35 @@ class DashboardAPITests(TestCase):
             password='userpass123'
         )
 
-        # Clear existing activities
-        LoginActivity.objects.filter(
-            user__in=[admin_user, regular_user1, regular_user2]).delete()
-
         # Create activities: 2 for admin, 3 for regular1, 1 for regular2
-        for i in range(2):
-            LoginActivity.objects.create(
+        LoginActivity.objects.bulk_create([
+            LoginActivity(
                 user=admin_user,
                 ip_address=f'192.168.1.{i+1}',
                 user_agent=f'Admin Browser {i+1}',
                 success=True
-            ).save()
+            )
+            for i in range(2)
+        ])
 
-        for i in range(3):
-            LoginActivity.objects.create(
+        LoginActivity.objects.bulk_create([
+            LoginActivity(
                 user=regular_user1,
                 ip_address=f'192.168.2.{i+1}',
                 user_agent=f'Regular1 Browser {i+1}',
                 success=True
-            ).save()
+            )
+            for i in range(3)
+        ])
 
         LoginActivity.objects.create(
             user=regular_user2,
             ip_address='192.168.3.1',
             user_agent='Regular2 Browser',
             success=True
-        ).save()
+        )
 
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:admin-dashboard')
+        url = self.admin_dashboard_url
 
         # Test filter=regular_users
         response = self.client.get(url, {'filter': 'regular_users'})
@@ -1110,93 +1086,420 @@ class DashboardAPITests(TestCase):
             password='adminpass123'
         )
 
-        # Create login activities for the other admin
-        for i in range(3):
-            activity = LoginActivity.objects.create(
-                user=other_admin,
-                ip_address=f'192.168.3.{i+1}',
-                user_agent=f'Other Admin Browser {i+1}',
-                success=True
+        now = timezone.now()
+
+        # Create login activities for the other admin
+        LoginActivity.objects.bulk_create([
+            LoginActivity(
+                user=other_admin,
+                ip_address=f'192.168.3.{i+1}',
+                user_agent=f'Other Admin Browser {i+1}',
+                success=True,
+                timestamp=now - timedelta(days=i)
+            )
+            for i in range(3)
+        ])
+
+        # Create login activities for the current admin user
+        LoginActivity.objects.bulk_create([
+            LoginActivity(
+                user=self.admin_user,
+                ip_address=f'192.168.4.{i+1}',
+                user_agent=f'Current Admin Browser {i+1}',
+                success=True,
+                timestamp=now - timedelta(days=i)
+            )
+            for i in range(2)
+        ])
+
+        url = self.admin_dashboard_url
+
+        # Get dashboard with filter=me
+        response = self.client.get(url, {'filter': 'me'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        # Should show data for only the current admin user
+        # total_users should be 1 (only current admin)
+        self.assertEqual(response.data['total_users'], 1)
+
+        # total_logins should be only current admin's logins (2)
+        self.assertEqual(response.data['total_logins'], 2)
+
+        # login_activity should only show current admin's activities
+        for activity in response.data['login_activity']:
+            self.assertEqual(activity['username'], self.admin_user.username)
+
+    def test_admin_dashboard_validates_user_ids_exist(self):
+        """Test that admin dashboard validates user_ids[] exist."""
+        url = self.admin_dashboard_url
+
+        # Test with non-existent user ID
+        response = self.client.get(url, {'user_ids[]': [99999]})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('error', response.data)
+
+    # Date filtering tests for USER-SPECIFIC endpoints
+    def test_user_specific_login_activity_invalid_date_format_returns_400(self):  # noqa: E501
+        """Test invalid date format in user-specific login activity."""  # noqa: E501
+        url = self.user_specific_login_activity_url
+
+        response = self.client.get(
+            url,
+            {
+                'start_date': 'not-a-date',
+                'end_date': '2025-12-31',
+            },
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data, _INVALID_DATE_ERR)
+
+    def test_user_specific_stats_invalid_date_format_returns_400(self):
+        """Test that invalid date format in user-specific stats returns 400 error."""  # noqa: E501
+        url = self.user_specific_stats_url
+
+        response = self.client.get(
+            url,
+            {
+                'start_date': 'invalid-date',
+                'end_date': '2025-12-31',
+            },
+            )
+
+        self.assertEqual(
+            response.status_code,
+            status.HTTP_400_BAD_REQUEST,
+        )
+        self.assertEqual(response.data, _INVALID_DATE_ERR)
+
+    def test_admin_dashboard_returns_etag(self):
+        """Test that admin dashboard responses include an ETag header."""
+        url = self.admin_dashboard_url
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.has_header('ETag'))
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_admin_dashboard_matching_etag_returns_304(self):
+        """Test that a matching If-None-Match header returns 304 without
+        re-running the dashboard queries."""
+        cache.clear()
+        self.addCleanup(cache.clear)
+        url = self.admin_dashboard_url
+
+        response = self.client.get(url)
+        etag = response['ETag']
+
+        # The cached data version is reused, so no queries are needed
+        with self.assertNumQueries(0):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_admin_dashboard_data_is_cached_per_filter(self):
+        """Test that repeated admin dashboard requests with the same
+        filters are served from cache."""
+        cache.clear()
+        self.addCleanup(cache.clear)
+        url = self.admin_dashboard_url
+
+        # ETag data version (2) and the dashboard queries (4)
+        with self.assertNumQueries(6):
+            first = self.client.get(url)
+        with self.assertNumQueries(0):
+            second = self.client.get(url)
+        self.assertEqual(first.data, second.data)
+
+        # Other filters are computed separately; the version stays cached
+        with self.assertNumQueries(4):
+            response = self.client.get(url, {'role': 'admin'})
+        self.assertEqual(response.data['total_users'], 1)
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_admin_dashboard_cache_holds_no_model_instances(self):
+        """Test that the cached admin dashboard data is the serialized
+        body, so no user rows are pickled into the cache."""
+        cache.clear()
+        self.addCleanup(cache.clear)
+
+        response = self.client.get(self.admin_dashboard_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['login_activity'])
+        # LocMemCache stores pickled values; model pickles go through
+        # django.db.models.base.model_unpickle
+        for pickled in cache._cache.values():
+            self.assertNotIn(b'model_unpickle', pickled)
+
+    @override_settings(CACHES=LOCMEM_CACHES)
+    def test_admin_dashboard_etag_matches_body_after_data_change(self):
+        """Test that once the data version moves on, the new ETag comes
+        with a recomputed body rather than the cached one."""
+        cache.clear()
+        self.addCleanup(cache.clear)
+        url = self.admin_dashboard_url
+
+        first = self.client.get(url)
+        LoginActivity.objects.create(
+            user=self.user,
+            ip_address='192.168.9.9',
+            user_agent='New Browser',
+            success=True
+        )
+        # As if the cached data version had expired
+        cache.delete('admin_dashboard_etag_version')
+
+        second = self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(second['ETag'], first['ETag'])
+        self.assertEqual(
+            second.data['total_logins'], first.data['total_logins'] + 1
+        )
+
+        # The new ETag revalidates against the body it came with
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=second['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_admin_dashboard_etag_differs_per_query(self):
+        """Test that different filter parameters produce different ETags."""
+        url = self.admin_dashboard_url
+
+        response_all = self.client.get(url)
+        response_me = self.client.get(url, {'me': 'true'})
+
+        self.assertNotEqual(response_all['ETag'], response_me['ETag'])
+
+    def test_admin_dashboard_etag_changes_when_user_role_changes(self):
+        """Test that promoting a user invalidates the role filter's ETag,
+        since no login or new user marks the change."""
+        url = self.admin_dashboard_url
+        params = {'role': 'admin'}
+        etag = self.client.get(url, params)['ETag']
+
+        self.user.is_staff = True
+        self.user.save()
+
+        response = self.client.get(url, params, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['total_users'], 2)
+        self.assertNotEqual(response['ETag'], etag)
+
+    def test_admin_dashboard_invalid_parameters_have_no_etag(self):
+        """Test that 400 responses for invalid parameters carry no ETag."""
+        url = self.admin_dashboard_url
+        cases = (
+            {'role': 'owner'},
+            {'filter': 'everyone'},
+            {'user_ids[]': 'abc'},
+            {'user_ids[]': 999999},
+            {'start_date': 'not-a-date'},
+        )
+
+        for params in cases:
+            with self.subTest(params=params):
+                response = self.client.get(url, params)
+
+                self.assertEqual(
+                    response.status_code, status.HTTP_400_BAD_REQUEST
+                )
+                self.assertFalse(response.has_header('ETag'))
+
+
+class AdminDashboardDateFilterTests(
+    AdminAuthMixin, WithoutLoginActivitiesMixin, DashboardAPITests
+):
+    """Admin dashboard API tests that create their own login activities."""
+
+    def test_admin_dashboard_date_range_filters_login_activities(self):
+        """
+        Test that date ranges correctly filter
+        login activities and counts.
+        """
+        base_time = timezone.now()
+
+        # Create activities in different date ranges
+        # Within date range (should be counted)
+        LoginActivity.objects.bulk_create([
+            LoginActivity(
+                user=self.user,
+                ip_address=f'192.168.1.{i+1}',
+                user_agent=f'Browser {i+1}',
+                success=True,
+                timestamp=base_time - timedelta(days=i+1)  # 1-3 days ago
+            )
+            for i in range(3)
+        ])
+
+        # Outside date range (should not be counted)
+        LoginActivity.objects.bulk_create([
+            LoginActivity(
+                user=self.user,
+                ip_address=f'192.168.2.{i+1}',
+                user_agent=f'Browser {i+1}',
+                success=True,
+                timestamp=base_time - timedelta(days=i+10)  # 10-11 days ago
+            )
+            for i in range(2)
+        ])
+
+        url = self.admin_dashboard_url
+
+        # Date range: 5 days ago to now (should include 3 activities)
+        start_date = (base_time - timedelta(days=5)).strftime('%Y-%m-%d')
+        end_date = base_time.strftime('%Y-%m-%d')
+
+        response = self.client.get(
+            url, {'start_date': start_date, 'end_date': end_date})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Should show 3 total logins within the date range
+        self.assertEqual(response.data['total_logins'], 3)
+        # Should show only 3 activities in the login_activity list
+        self.assertEqual(len(response.data['login_activity']), 3)
+
+    def test_admin_dashboard_partial_date_ranges_work(self):
+        """
+        Test that partial date ranges (start only, end only)
+        work correctly.
+        """
+        base_time = timezone.now()
+
+        # Create activities at different times
+        LoginActivity.objects.bulk_create([
+            LoginActivity(
+                user=self.user,
+                ip_address=f'192.168.1.{i+1}',
+                user_agent=f'Browser {i+1}',
+                success=True,
+                # 0, 2, 4, 6, 8 days ago
+                timestamp=base_time - timedelta(days=i*2)
+            )
+            for i in range(5)
+        ])
+
+        url = self.admin_dashboard_url
+
+        # Test start_date only (from 5 days ago onwards)
+        start_date = (base_time - timedelta(days=5)).strftime('%Y-%m-%d')
+        response = self.client.get(url, {'start_date': start_date})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Should include activities from 0, 2, 4 days ago (3 activities)
+        self.assertEqual(response.data['total_logins'], 3)
+
+        # Test end_date only (up to 3 days ago)
+        end_date = (base_time - timedelta(days=3)).strftime('%Y-%m-%d')
+        response = self.client.get(url, {'end_date': end_date})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Should include activities from 4, 6, 8 days ago (3 activities)
+        self.assertEqual(response.data['total_logins'], 3)
+
+    def test_admin_dashboard_date_filtering_with_user_filtering(self):
+        """Test that date filtering works correctly with user filtering."""
+        # Create additional user
+        other_user = User.objects.create_user(
+            username='otheruser',
+            email='other@example.com',
+            password='testpass123'
+        )
+
+        base_time = timezone.now()
+
+        # Create activities for both users
+        # User 1: 3 activities within date range
+        LoginActivity.objects.bulk_create([
+            LoginActivity(
+                user=self.user,
+                ip_address=f'192.168.1.{i+1}',
+                user_agent=f'Browser {i+1}',
+                success=True,
+                timestamp=base_time - timedelta(days=i+1)
             )
-            activity.timestamp = timezone.now() - timedelta(days=i)
-            activity.save()
+            for i in range(3)
+        ])
 
-        # Create login activities for the current admin user
-        for i in range(2):
-            activity = LoginActivity.objects.create(
-                user=self.admin_user,
-                ip_address=f'192.168.4.{i+1}',
-                user_agent=f'Current Admin Browser {i+1}',
-                success=True
+        # User 2: 2 activities within date range
+        LoginActivity.objects.bulk_create([
+            LoginActivity(
+                user=other_user,
+                ip_address=f'192.168.2.{i+1}',
+                user_agent=f'Browser {i+1}',
+                success=True,
+                timestamp=base_time - timedelta(days=i+1)
             )
-            activity.timestamp = timezone.now() - timedelta(days=i)
-            activity.save()
+            for i in range(2)
+        ])
 
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:admin-dashboard')
+        # User 2: 1 activity outside date range
+        LoginActivity.objects.create(
+            user=other_user,
+            ip_address='192.168.2.99',
+            user_agent='Browser Outside',
+            success=True,
+            timestamp=base_time - timedelta(days=10)
+        )
 
-        # Get dashboard with filter=me
-        response = self.client.get(url, {'filter': 'me'})
+        url = self.admin_dashboard_url
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Filter by user_ids and date range
+        start_date = (base_time - timedelta(days=5)).strftime('%Y-%m-%d')
+        end_date = base_time.strftime('%Y-%m-%d')
 
-        # Should show data for only the current admin user
-        # total_users should be 1 (only current admin)
-        self.assertEqual(response.data['total_users'], 1)
+        response = self.client.get(url, {
+            'user_ids[]': [other_user.id],
+            'start_date': start_date,
+            'end_date': end_date
+        })
 
-        # total_logins should be only current admin's logins (2)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Should show only other_user
+        self.assertEqual(response.data['total_users'], 1)
+        # Should show only 2 logins (within date range for other_user)
         self.assertEqual(response.data['total_logins'], 2)
 
-        # login_activity should only show current admin's activities
-        for activity in response.data['login_activity']:
-            self.assertEqual(activity['username'], self.admin_user.username)
-
-    def test_admin_dashboard_validates_user_ids_exist(self):
-        """Test that admin dashboard validates user_ids[] exist."""
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:admin-dashboard')
-
-        # Test with non-existent user ID
-        response = self.client.get(url, {'user_ids[]': [99999]})
-
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertIn('error', response.data)
-
     def test_admin_dashboard_total_logins_includes_failed_attempts(self):
         """
         Test that total_logins counts ALL login attempts (successful + failed).
         """
-        # Clear existing activities for clean test
-        LoginActivity.objects.filter(user=self.user).delete()
+        now = timezone.now()
 
         # Create 3 successful login activities
-        for i in range(3):
-            activity = LoginActivity.objects.create(
+        LoginActivity.objects.bulk_create([
+            LoginActivity(
                 user=self.user,
                 ip_address=f'192.168.1.{i+1}',
                 user_agent=f'Success Browser {i+1}',
-                success=True
+                success=True,
+                timestamp=now - timedelta(days=i)
             )
-            activity.timestamp = timezone.now() - timedelta(days=i)
-            activity.save()
+            for i in range(3)
+        ])
 
         # Create 2 failed login activities
-        for i in range(2):
-            activity = LoginActivity.objects.create(
+        LoginActivity.objects.bulk_create([
+            LoginActivity(
                 user=self.user,
                 ip_address=f'192.168.2.{i+1}',
                 user_agent=f'Failed Browser {i+1}',
-                success=False
+                success=False,
+                timestamp=now - timedelta(days=i+5)
             )
-            activity.timestamp = timezone.now() - timedelta(days=i+5)
-            activity.save()
+            for i in range(2)
+        ])
 
         # Verify we have 5 total activities (3 successful + 2 failed)
         total_activities = LoginActivity.objects.filter(user=self.user).count()
         self.assertEqual(total_activities, 5)
 
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:admin-dashboard')
+        url = self.admin_dashboard_url
 
         # Test admin dashboard with user_ids filter to only show
         # our test user's data
@@ -1232,33 +1535,33 @@ class DashboardAPITests(TestCase):
         """
         Test that admin dashboard includes successful/failed login counts.
         """
-        # Clear existing activities for clean test
-        LoginActivity.objects.filter(user=self.user).delete()
+        now = timezone.now()
 
         # Create 4 successful login activities
-        for i in range(4):
-            activity = LoginActivity.objects.create(
+        LoginActivity.objects.bulk_create([
+            LoginActivity(
                 user=self.user,
                 ip_address=f'192.168.1.{i+1}',
                 user_agent=f'Success Browser {i+1}',
-                success=True
+                success=True,
+                timestamp=now - timedelta(days=i)
             )
-            activity.timestamp = timezone.now() - timedelta(days=i)
-            activity.save()
+            for i in range(4)
+        ])
 
         # Create 3 failed login activities
-        for i in range(3):
-            activity = LoginActivity.objects.create(
+        LoginActivity.objects.bulk_create([
+            LoginActivity(
                 user=self.user,
                 ip_address=f'192.168.2.{i+1}',
                 user_agent=f'Failed Browser {i+1}',
-                success=False
+                success=False,
+                timestamp=now - timedelta(days=i+5)
             )
-            activity.timestamp = timezone.now() - timedelta(days=i+5)
-            activity.save()
+            for i in range(3)
+        ])
 
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:admin-dashboard')
+        url = self.admin_dashboard_url
 
         # Test admin dashboard with user_ids filter
         # to only show our test user's data
@@ -1285,147 +1588,58 @@ class DashboardAPITests(TestCase):
             + response.data['total_failed_logins']
         )
 
-    # Date filtering tests for USER-SPECIFIC endpoints
     def test_user_specific_login_activity_date_filtering_works(self):
         """Test user-specific login activity endpoint date filtering."""  # noqa: E501
-        # Clear existing activities
-        LoginActivity.objects.filter(user=self.user).delete()
-
         base_time = timezone.now()
 
         # Create activities in different date ranges
         # Within date range
-        for i in range(3):
-            activity = LoginActivity.objects.create(
+        LoginActivity.objects.bulk_create([
+            LoginActivity(
                 user=self.user,
                 ip_address=f'192.168.1.{i+1}',
                 user_agent=f'Browser {i+1}',
-                success=True
+                success=True,
+                timestamp=base_time - timedelta(days=i+1)
             )
-            activity.timestamp = base_time - timedelta(days=i+1)
-            activity.save()
+            for i in range(3)
+        ])
 
         # Outside date range
-        for i in range(2):
-            activity = LoginActivity.objects.create(
+        LoginActivity.objects.bulk_create([
+            LoginActivity(
                 user=self.user,
                 ip_address=f'192.168.2.{i+1}',
                 user_agent=f'Browser {i+1}',
-                success=False
+                success=False,
+                timestamp=base_time - timedelta(days=i+10)
             )
-            activity.timestamp = base_time - timedelta(days=i+10)
-            activity.save()
+            for i in range(2)
+        ])
 
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse(
-            'user:user-specific-login-activity',
-            kwargs={'user_id': self.user.id},
-        )
+        url = self.user_specific_login_activity_url
 
         # Date range: 5 days ago to now
         start_date = (base_time - timedelta(days=5)).strftime('%Y-%m-%d')
         end_date = base_time.strftime('%Y-%m-%d')
 
-        response = self.client.get(
-            url,
-            {
-                'start_date': start_date,
-                'end_date': end_date
-            },
-        )
+        # Look up the user, then one page of activities with their users
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                url,
+                {
+                    'start_date': start_date,
+                    'end_date': end_date
+                },
+            )
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         # Should return only 3 activities within the date range
         self.assertEqual(response.data['count'], 3)
 
-    def test_user_specific_login_activity_invalid_date_format_returns_400(self):  # noqa: E501
-        """Test invalid date format in user-specific login activity."""  # noqa: E501
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:user-specific-login-activity',
-                      kwargs={'user_id': self.user.id})
-
-        response = self.client.get(
-            url,
-            {
-                'start_date': 'not-a-date',
-                'end_date': '2025-12-31',
-            },
-        )
-
-        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
-        self.assertEqual(
-            response.data,
-            {
-                'error': 'Invalid date format. Use YYYY-MM-DD format.',
-            },
-        )
-
-    # TDD: Tests for total_successful_logins and total_failed_logins
-    def test_user_stats_includes_successful_and_failed_logins(self):
-        """Test that user stats includes total_successful_logins and
-        total_failed_logins."""
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:dashboard-stats')
-        response = self.client.get(url)
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn('total_successful_logins', response.data)
-        self.assertIn('total_failed_logins', response.data)
-        self.assertIsInstance(response.data['total_successful_logins'], int)
-        self.assertIsInstance(response.data['total_failed_logins'], int)
-
-    def test_user_stats_successful_and_failed_counts_are_accurate(self):
-        """Test that successful and failed login counts match actual
-        LoginActivity records."""
-        # Clear existing activities
-        LoginActivity.objects.filter(user=self.user).delete()
-
-        # Create exactly 3 successful and 2 failed logins
-        for i in range(3):
-            LoginActivity.objects.create(
-                user=self.user,
-                ip_address=f'192.168.1.{i+1}',
-                user_agent=f'Success Browser {i+1}',
-                success=True
-            )
-        for i in range(2):
-            LoginActivity.objects.create(
-                user=self.user,
-                ip_address=f'192.168.2.{i+1}',
-                user_agent=f'Fail Browser {i+1}',
-                success=False
-            )
-
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:dashboard-stats')
-        response = self.client.get(url)
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data['total_successful_logins'], 3)
-        self.assertEqual(response.data['total_failed_logins'], 2)
-        # total_logins should be sum of successful + failed
-        self.assertEqual(response.data['total_logins'], 5)
-
-    def test_user_stats_data_structure_includes_new_fields(self):
-        """Test that user stats response includes the new fields in data
-        structure."""
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:dashboard-stats')
-        response = self.client.get(url)
-
-        expected_keys = [
-            'total_logins', 'last_login', 'weekly_data',
-            'monthly_data', 'login_trend',
-            'total_successful_logins', 'total_failed_logins'
-        ]
-        self.assertEqual(set(response.data.keys()), set(expected_keys))
-
     def test_admin_dashboard_user_stats_matches_regular_user_stats(self):
         """Integration test: admin dashboard filtered by user_id should show
         same success/fail counts as that user's own stats."""
-        # Clear all activities first
-        LoginActivity.objects.all().delete()
-
         # Create a new regular user
         regular_user = User.objects.create_user(
             username='regularstatsuser',
@@ -1435,13 +1649,15 @@ class DashboardAPITests(TestCase):
 
         # Create mixed login activities for this user
         # 4 successful, 1 failed
-        for i in range(4):
-            LoginActivity.objects.create(
+        LoginActivity.objects.bulk_create([
+            LoginActivity(
                 user=regular_user,
                 ip_address=f'10.0.0.{i+1}',
                 user_agent=f'Regular Browser {i+1}',
                 success=True
             )
+            for i in range(4)
+        ])
         LoginActivity.objects.create(
             user=regular_user,
             ip_address='10.0.0.99',
@@ -1451,7 +1667,7 @@ class DashboardAPITests(TestCase):
 
         # Get regular user's own stats
         self.client.force_authenticate(user=regular_user)
-        url = reverse('user:dashboard-stats')
+        url = self.dashboard_stats_url
         user_response = self.client.get(url)
 
         self.assertEqual(user_response.status_code, status.HTTP_200_OK)
@@ -1461,7 +1677,7 @@ class DashboardAPITests(TestCase):
 
         # Now login as admin and get dashboard for this specific user
         self.client.force_authenticate(user=self.admin_user)
-        admin_url = reverse('user:admin-dashboard')
+        admin_url = self.admin_dashboard_url
         admin_response = self.client.get(
             admin_url, {'user_ids[]': [regular_user.id]}
         )
@@ -1495,116 +1711,81 @@ class DashboardAPITests(TestCase):
 
     def test_user_specific_stats_date_filtering_works(self):
         """Test user-specific stats endpoint date filtering."""  # noqa: E501
-        # Clear existing activities
-        LoginActivity.objects.filter(user=self.user).delete()
-
         base_time = timezone.now()
 
         # Create activities in specific date ranges
         # Within date range (should be counted)
-        for i in range(3):
-            activity = LoginActivity.objects.create(
+        LoginActivity.objects.bulk_create([
+            LoginActivity(
                 user=self.user,
                 ip_address=f'192.168.1.{i+1}',
                 user_agent=f'Browser {i+1}',
-                success=True
+                success=True,
+                timestamp=base_time - timedelta(days=i+1)
             )
-            activity.timestamp = base_time - timedelta(days=i+1)
-            activity.save()
+            for i in range(3)
+        ])
 
         # Outside date range (should not be counted)
-        for i in range(2):
-            activity = LoginActivity.objects.create(
+        LoginActivity.objects.bulk_create([
+            LoginActivity(
                 user=self.user,
                 ip_address=f'192.168.2.{i+1}',
                 user_agent=f'Browser {i+1}',
-                success=True
+                success=True,
+                timestamp=base_time - timedelta(days=i+10)
             )
-            activity.timestamp = base_time - timedelta(days=i+10)
-            activity.save()
+            for i in range(2)
+        ])
 
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse(
-            'user:user-specific-stats',
-            kwargs={'user_id': self.user.id}
-        )
+        url = self.user_specific_stats_url
 
         # Date range: 5 days ago to now
         start_date = (base_time - timedelta(days=5)).strftime('%Y-%m-%d')
         end_date = base_time.strftime('%Y-%m-%d')
 
-        response = self.client.get(
-            url,
-            {
-                'start_date': start_date,
-                'end_date': end_date,
-                },
-        )
+        # Look up the user, count successes and failures, group successful
+        # logins by day, then count each half of the range for the trend
+        with self.assertNumQueries(5):
+            response = self.client.get(
+                url,
+                {
+                    'start_date': start_date,
+                    'end_date': end_date,
+                    },
+            )
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         # Should count only the 3 activities within the date range
         self.assertEqual(response.data['total_logins'], 3)
 
-    def test_user_specific_stats_invalid_date_format_returns_400(self):
-        """Test that invalid date format in user-specific stats returns 400 error."""  # noqa: E501
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse(
-            'user:user-specific-stats',
-            kwargs={'user_id': self.user.id},
-        )
-
-        response = self.client.get(
-            url,
-            {
-                'start_date': 'invalid-date',
-                'end_date': '2025-12-31',
-            },
-            )
-
-        self.assertEqual(
-            response.status_code,
-            status.HTTP_400_BAD_REQUEST,
-        )
-        self.assertEqual(
-            response.data,
-            {
-                'error': 'Invalid date format. Use YYYY-MM-DD format.',
-            },
-        )
-
-    # TDD: Tests for end-of-day inclusion bug
-    # (date filter should include full day)
-    def test_user_stats_includes_logins_on_last_day_of_range(self):
-        """Test that user stats includes logins occurring on the last day
-        of the date range, even if they are after midnight.
+    def test_admin_dashboard_includes_logins_on_last_day_of_range(self):
+        """Test that admin dashboard includes logins occurring on the
+        last day of the date range, even if they are after midnight.
 
         Regression test: the old code parsed end_date as
         YYYY-MM-DD 00:00:00, which excluded any login after midnight
         on the last day.
         """
-        # Clear existing activities
-        LoginActivity.objects.filter(user=self.user).delete()
-
         # Create a login at 3:00 PM today (after midnight)
         today_3pm = timezone.now().replace(
             hour=15, minute=0, second=0, microsecond=0
         )
-        activity = LoginActivity.objects.create(
+        LoginActivity.objects.create(
             user=self.user,
             ip_address='192.168.1.100',
             user_agent='Test Browser',
-            success=True
+            success=True,
+            timestamp=today_3pm
         )
-        activity.timestamp = today_3pm
-        activity.save()
 
-        self.client.force_authenticate(user=self.user)
-        url = reverse('user:dashboard-stats')
+        url = self.admin_dashboard_url
 
         # Query with today as both start and end date
         today_str = today_3pm.strftime('%Y-%m-%d')
 
         response = self.client.get(url, {
+            'user_ids[]': [self.user.id],
             'start_date': today_str,
             'end_date': today_str,
         })
@@ -1614,49 +1795,83 @@ class DashboardAPITests(TestCase):
         self.assertEqual(
             response.data['total_logins'],
             1,
-            "Login at 3:00 PM on last day should be included in range"
+            "Login at 3:00 PM on the last day should be included in date range"
         )
 
-    def test_admin_dashboard_includes_logins_on_last_day_of_range(self):
-        """Test that admin dashboard includes logins occurring on the
-        last day of the date range, even if they are after midnight.
 
-        Regression test: the old code parsed end_date as
-        YYYY-MM-DD 00:00:00, which excluded any login after midnight
-        on the last day.
-        """
-        # Clear existing activities
-        LoginActivity.objects.filter(user=self.user).delete()
+class AdminMeParamTests(AdminAuthMixin, DashboardAPITests):
+    """Admin dashboard tests for the me parameter, run as the admin user."""
 
-        # Create a login at 3:00 PM today (after midnight)
-        today_3pm = timezone.now().replace(
-            hour=15, minute=0, second=0, microsecond=0
+    @classmethod
+    def setUpTestData(cls):
+        """Add another admin, a regular user and admin login activities."""
+        super().setUpTestData()
+        # Additional users and login activities to ensure filtering works
+        cls.other_admin = User.objects.create_superuser(
+            username='otheradmin',
+            email='otheradmin@example.com',
+            password='adminpass123'
         )
-        activity = LoginActivity.objects.create(
-            user=self.user,
-            ip_address='192.168.1.100',
-            user_agent='Test Browser',
-            success=True
+        cls.regular_user = User.objects.create_user(
+            username='regularuser2',
+            email='regularuser2@example.com',
+            password='userpass123'
         )
-        activity.timestamp = today_3pm
-        activity.save()
 
-        self.client.force_authenticate(user=self.admin_user)
-        url = reverse('user:admin-dashboard')
+        now = timezone.now()
+        LoginActivity.objects.bulk_create(
+            # Login activities for the other admin
+            [
+                LoginActivity(
+                    user=cls.other_admin,
+                    ip_address=f'192.168.3.{i+1}',
+                    user_agent=f'Other Admin Browser {i+1}',
+                    success=True,
+                    timestamp=now - timedelta(days=i)
+                )
+                for i in range(3)
+            ]
+            # Login activities for the current admin user
+            + [
+                LoginActivity(
+                    user=cls.admin_user,
+                    ip_address=f'192.168.4.{i+1}',
+                    user_agent=f'Current Admin Browser {i+1}',
+                    success=True,
+                    timestamp=now - timedelta(days=i)
+                )
+                for i in range(2)
+            ]
+        )
 
-        # Query with today as both start and end date
-        today_str = today_3pm.strftime('%Y-%m-%d')
+    def test_admin_dashboard_me_parameter_shows_current_user_data(self):
+        """Test that me=true parameter shows only current admin user's data in dashboard format."""  # noqa: E501
+        url = self.admin_dashboard_url
 
-        response = self.client.get(url, {
-            'user_ids[]': [self.user.id],
-            'start_date': today_str,
-            'end_date': today_str,
-        })
+        # Get dashboard with me=true
+        response = self.client.get(url, {'me': 'true'})
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        # The login at 3 PM today MUST be included
-        self.assertEqual(
-            response.data['total_logins'],
-            1,
-            "Login at 3:00 PM on the last day should be included in date range"
-        )
+
+        # Should show data for only the current admin user
+        # total_users should be 1 (only current admin)
+        self.assertEqual(response.data['total_users'], 1)
+
+        # total_logins should be only current admin's logins (2)
+        self.assertEqual(response.data['total_logins'], 2)
+
+        # login_activity should only show current admin's activities
+        self.assertIsInstance(response.data['login_activity'], list)
+        for activity in response.data['login_activity']:
+            self.assertEqual(activity['username'], self.admin_user.username)
+
+    def test_admin_dashboard_me_parameter_takes_precedence_over_role(self):
+        """Test that me=true parameter takes precedence over role parameter."""
+        url = self.admin_dashboard_url
+
+        # Use both me=true and role=regular - me should take precedence
+        response = self.client.get(url, {'me': 'true', 'role': 'regular'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        # Should show only current admin user's data, not regular users
+        self.assertEqual(response.data['total_users'], 1)
@@ -1,5 +1,10 @@
 """Tests for login activity pagination with role-based access."""
+from unittest import mock
+
+from django.db import connection
+from django.db.models import QuerySet
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework.test import APIClient
 from rest_framework import status
@@ -279,3 +284,85 @@ class LoginActivityPaginationTests(TestCase):
         self.assertEqual(response_page2.data['count'], 100)
         # Returns last available page (page 1 with 100 items)
         self.assertEqual(len(response_page2.data['results']), 100)
+
+    def test_first_page_counts_rows_only_when_full(self):
+        """
+        Test that page 1 skips the COUNT query when it holds every
+        record, and still reports the total when more pages follow.
+        """
+        self.client.force_authenticate(user=self.regular_user)
+        url = reverse(
+            'user:user-specific-login-activity',
+            kwargs={'user_id': self.regular_user.id}
+        )
+
+        for count, size, counted in ((50, 100, False), (150, 100, True)):
+            with self.subTest(count=count, size=size):
+                LoginActivity.objects.filter(user=self.regular_user).delete()
+                self._create_login_activities(self.regular_user, count)
+
+                with CaptureQueriesContext(connection) as queries:
+                    response = self.client.get(url, {'page': 1, 'size': size})
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.data['count'], count)
+                self.assertEqual(
+                    len(response.data['results']), min(count, size)
+                )
+                self.assertEqual(
+                    any('COUNT(' in q['sql'].upper() for q in queries),
+                    counted
+                )
+
+    def test_later_pages_keep_newest_first_order(self):
+        """
+        Test that a page after the first, whose rows are looked up by
+        primary key, keeps the newest first order of the full listing.
+        """
+        self._create_login_activities(self.regular_user, 25)
+        self.client.force_authenticate(user=self.regular_user)
+        url = reverse(
+            'user:user-specific-login-activity',
+            kwargs={'user_id': self.regular_user.id}
+        )
+        expected_ids = list(
+            LoginActivity.objects.filter(
+                user=self.regular_user
+            ).order_by('-timestamp').values_list('id', flat=True)[10:20]
+        )
+
+        # Look up the user, count the rows, then find the page's primary
+        # keys and fetch those rows with their users
+        with self.assertNumQueries(4):
+            response = self.client.get(url, {'page': 2, 'size': 10})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [activity['id'] for activity in response.data['results']],
+            expected_ids
+        )
+
+    def test_later_page_skips_rows_deleted_mid_request(self):
+        """
+        Test that a row deleted between looking up a page's primary keys
+        and fetching its rows is left off the page instead of failing.
+        """
+        self._create_login_activities(self.regular_user, 25)
+        self.client.force_authenticate(user=self.regular_user)
+        url = reverse(
+            'user:user-specific-login-activity',
+            kwargs={'user_id': self.regular_user.id}
+        )
+        in_bulk = QuerySet.in_bulk
+
+        def delete_first_then_in_bulk(queryset, id_list=None, **kwargs):
+            LoginActivity.objects.filter(pk=id_list[0]).delete()
+            return in_bulk(queryset, id_list, **kwargs)
+
+        with mock.patch.object(
+            QuerySet, 'in_bulk', delete_first_then_in_bulk
+        ):
+            response = self.client.get(url, {'page': 2, 'size': 10})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 9)
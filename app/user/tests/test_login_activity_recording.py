@@ -35,6 +35,7 @@ class LoginActivityRecordingTests(TestCase):
 
     def _create_test_login_activities(self):
         """Create test login activities for the user."""
+        now = timezone.now()
         # Create successful logins for the user
         for i in range(5):
             LoginActivity.objects.create(
@@ -42,7 +43,7 @@ class LoginActivityRecordingTests(TestCase):
                 ip_address=f'192.168.1.{i+1}',
                 user_agent=f'Test Browser {i+1}',
                 success=True,
-                timestamp=timezone.now() - timedelta(days=i)
+                timestamp=now - timedelta(days=i)
             )
 
         # Create some failed logins
@@ -52,7 +53,7 @@ class LoginActivityRecordingTests(TestCase):
                 ip_address=f'192.168.2.{i+1}',
                 user_agent=f'Test Browser {i+1}',
                 success=False,
-                timestamp=timezone.now() - timedelta(days=i+10)
+                timestamp=now - timedelta(days=i+10)
             )
 
     def test_user_stats_endpoint_requires_authentication(self):
@@ -0,0 +1,38 @@
+"""Meta tests for the user app test suite itself."""
+import importlib
+import inspect
+import pkgutil
+
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
+
+import user.tests
+
+
+class TestCaseTypeTests(SimpleTestCase):
+    """Guard the test suite against slow test case base classes."""
+
+    def test_no_transaction_test_cases_without_reason(self):
+        """Test that no test class uses TransactionTestCase undocumented.
+
+        TransactionTestCase truncates every table after each test instead
+        of rolling back a transaction, which is far slower. A class that
+        genuinely needs it must say why in a `transaction_test_reason`
+        class attribute.
+        """
+        offenders = []
+        for module_info in pkgutil.iter_modules(user.tests.__path__):
+            module = importlib.import_module(
+                f'{user.tests.__name__}.{module_info.name}'
+            )
+            for name, cls in inspect.getmembers(module, inspect.isclass):
+                if cls.__module__ != module.__name__:
+                    continue
+                if (issubclass(cls, TransactionTestCase)
+                        and not issubclass(cls, TestCase)
+                        and not getattr(cls, 'transaction_test_reason', '')):
+                    offenders.append(f'{module.__name__}.{name}')
+
+        self.assertEqual(
+            offenders, [],
+            'Use django.test.TestCase, or set transaction_test_reason'
+        )
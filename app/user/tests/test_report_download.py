@@ -118,13 +118,14 @@ class ReportDownloadModeTests(TestCase):
         self._create_test_data()
 
     def _create_test_data(self):
+        now = timezone.now()
         for i in range(5):
             LoginActivity.objects.create(
                 user=self.user1,
                 ip_address=f'192.168.1.{i+1}',
                 user_agent=f'Browser {i+1}',
                 success=True,
-                timestamp=timezone.now() - timedelta(days=i)
+                timestamp=now - timedelta(days=i)
             )
         for i in range(3):
             LoginActivity.objects.create(
@@ -132,7 +133,7 @@ class ReportDownloadModeTests(TestCase):
                 ip_address=f'192.168.2.{i+1}',
                 user_agent=f'Browser {i+1}',
                 success=True,
-                timestamp=timezone.now() - timedelta(days=i)
+                timestamp=now - timedelta(days=i)
             )
 
     def test_regular_user_individual_mode_returns_own_data(self):
@@ -282,13 +283,15 @@ class ReportDownloadDropdownSelectionTests(TestCase):
         self.client = APIClient()
         self.url = reverse('user:report-download')
 
+        now = timezone.now()
+
         # Create login activity for admin
         LoginActivity.objects.create(
             user=self.admin_user,
             ip_address='192.168.0.1',
             user_agent='Admin Browser',
             success=True,
-            timestamp=timezone.now() - timedelta(days=1)
+            timestamp=now - timedelta(days=1)
         )
         # Create login activity for normal user
         for i in range(5):
@@ -297,7 +300,7 @@ class ReportDownloadDropdownSelectionTests(TestCase):
                 ip_address=f'192.168.1.{i+1}',
                 user_agent=f'Normal Browser {i+1}',
                 success=i % 4 != 0,  # 4 successful, 1 failed
-                timestamp=timezone.now() - timedelta(days=i)
+                timestamp=now - timedelta(days=i)
             )
 
     def test_header_shows_logged_user_and_selected_user_dropdown(self):
@@ -508,13 +511,14 @@ class ReportDownloadDateFilterTests(TestCase):
         self._create_test_data()
 
     def _create_test_data(self):
+        now = timezone.now()
         for i in range(5):
             LoginActivity.objects.create(
                 user=self.user,
                 ip_address=f'192.168.1.{i+1}',
                 user_agent=f'Browser {i+1}',
                 success=True,
-                timestamp=timezone.now() - timedelta(days=i)
+                timestamp=now - timedelta(days=i)
             )
         for i in range(3):
             LoginActivity.objects.create(
@@ -522,7 +526,7 @@ class ReportDownloadDateFilterTests(TestCase):
                 ip_address=f'192.168.2.{i+1}',
                 user_agent=f'Browser {i+1}',
                 success=False,
-                timestamp=timezone.now() - timedelta(days=15+i)
+                timestamp=now - timedelta(days=15+i)
             )
 
     def test_date_filter_with_start_date(self):
@@ -593,13 +597,14 @@ class ReportDownloadExcelTests(TestCase):
         self._create_test_data()
 
     def _create_test_data(self):
+        now = timezone.now()
         for i in range(10):
             LoginActivity.objects.create(
                 user=self.user,
                 ip_address=f'192.168.1.{i+1}',
                 user_agent=f'Firefox Browser {i+1}',
                 success=i % 4 != 0,
-                timestamp=timezone.now() - timedelta(days=i)
+                timestamp=now - timedelta(days=i)
             )
 
     def test_excel_download_returns_excel_content_type(self):
@@ -747,13 +752,15 @@ class ReportDownloadSelectedUserTests(TestCase):
         self.client = APIClient()
         self.url = reverse('user:report-download')
 
+        now = timezone.now()
+
         # Create login activity for admin
         LoginActivity.objects.create(
             user=self.admin_user,
             ip_address='192.168.0.1',
             user_agent='Admin Browser',
             success=True,
-            timestamp=timezone.now() - timedelta(days=1)
+            timestamp=now - timedelta(days=1)
         )
         # Create 5 login activities for normal_user1
         for i in range(5):
@@ -762,7 +769,7 @@ class ReportDownloadSelectedUserTests(TestCase):
                 ip_address=f'192.168.1.{i+1}',
                 user_agent=f'User1 Browser {i+1}',
                 success=i % 4 != 0,
-                timestamp=timezone.now() - timedelta(days=i)
+                timestamp=now - timedelta(days=i)
             )
         # Create 3 login activities for normal_user2
         for i in range(3):
@@ -771,7 +778,7 @@ class ReportDownloadSelectedUserTests(TestCase):
                 ip_address=f'192.168.2.{i+1}',
                 user_agent=f'User2 Browser {i+1}',
                 success=True,
-                timestamp=timezone.now() - timedelta(days=i)
+                timestamp=now - timedelta(days=i)
             )
 
     def test_grouped_mode_with_selected_user_id_shows_correct_label(self):
@@ -981,13 +988,15 @@ class ReportDownloadGroupedModeHeaderTests(TestCase):
         self.client = APIClient()
         self.url = reverse('user:report-download')
 
+        now = timezone.now()
+
         # Create login activity for admin
         LoginActivity.objects.create(
             user=self.admin_user,
             ip_address='192.168.0.1',
             user_agent='Admin Browser',
             success=True,
-            timestamp=timezone.now() - timedelta(days=1)
+            timestamp=now - timedelta(days=1)
         )
         # Create login activities for normal_user
         for i in range(5):
@@ -996,7 +1005,7 @@ class ReportDownloadGroupedModeHeaderTests(TestCase):
                 ip_address=f'192.168.1.{i+1}',
                 user_agent=f'Normal Browser {i+1}',
                 success=i % 4 != 0,
-                timestamp=timezone.now() - timedelta(days=i)
+                timestamp=now - timedelta(days=i)
             )
 
     def _get_excel_text(self, params):
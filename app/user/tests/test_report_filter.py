@@ -35,6 +35,7 @@ class ReportDownloadFilterParameterTests(TestCase):
         self.client = APIClient()
         self.url = reverse('user:report-download')
 
+        now = timezone.now()
         # Create login activities for regular users
         for i in range(3):
             LoginActivity.objects.create(
@@ -42,7 +43,7 @@ class ReportDownloadFilterParameterTests(TestCase):
                 ip_address=f'192.168.1.{i+1}',
                 user_agent='Chrome',
                 success=True,
-                timestamp=timezone.now() - timedelta(days=i)
+                timestamp=now - timedelta(days=i)
             )
         for i in range(2):
             LoginActivity.objects.create(
@@ -50,7 +51,7 @@ class ReportDownloadFilterParameterTests(TestCase):
                 ip_address=f'192.168.2.{i+1}',
                 user_agent='Firefox',
                 success=True,
-                timestamp=timezone.now() - timedelta(days=i)
+                timestamp=now - timedelta(days=i)
             )
 
     def test_filter_admin_only_returns_admin_users_data(self):
@@ -298,13 +299,14 @@ class ReportDownloadFilterInExcelContentTests(TestCase):
         self.client = APIClient()
         self.url = reverse('user:report-download')
 
+        now = timezone.now()
         for i in range(3):
             LoginActivity.objects.create(
                 user=self.regular_user,
                 ip_address=f'192.168.1.{i+1}',
                 user_agent='Firefox',
                 success=True,
-                timestamp=timezone.now() - timedelta(days=i)
+                timestamp=now - timedelta(days=i)
             )
 
     def _get_excel_text(self, params):
@@ -52,6 +52,7 @@ class RoleBasedAccessTests(TestCase):
 
     def _create_test_login_activities(self):
         """Create test login activities for users."""
+        now = timezone.now()
         # Create successful logins for user1
         for i in range(3):
             LoginActivity.objects.create(
@@ -59,7 +60,7 @@ class RoleBasedAccessTests(TestCase):
                 ip_address=f'192.168.1.{i+1}',
                 user_agent=f'Test Browser {i+1}',
                 success=True,
-                timestamp=timezone.now() - timedelta(days=i)
+                timestamp=now - timedelta(days=i)
             )
 
         # Create successful logins for user2
@@ -69,7 +70,7 @@ class RoleBasedAccessTests(TestCase):
                 ip_address=f'192.168.2.{i+1}',
                 user_agent=f'Test Browser {i+1}',
                 success=True,
-                timestamp=timezone.now() - timedelta(days=i+5)
+                timestamp=now - timedelta(days=i+5)
             )
 
     # Test 1: User can access own dashboard stats
@@ -304,6 +305,7 @@ class RoleBasedAccessTests(TestCase):
     # Test 20: Login activity pagination works correctly
     def test_login_activity_pagination(self):
         """Test that login activity pagination works correctly."""
+        now = timezone.now()
         # Create more login activities for user1
         for i in range(10):
             LoginActivity.objects.create(
@@ -311,7 +313,7 @@ class RoleBasedAccessTests(TestCase):
                 ip_address=f'192.168.1.{i+10}',
                 user_agent=f'Test Browser {i+10}',
                 success=True,
-                timestamp=timezone.now() - timedelta(hours=i)
+                timestamp=now - timedelta(hours=i)
             )
 
         self.client.force_authenticate(user=self.admin_user)
@@ -144,6 +144,35 @@ class PublicUserApiTests(TestCase):
         self.assertEqual(res.data['passwordRepeat']
                          [0], 'password_mismatch')
 
+    def test_create_user_mismatch_reported_with_other_field_errors(self):
+        """Test that a password mismatch is reported together with the
+        errors of other invalid fields."""
+        payload = {
+            'username': '',
+            'email': 'test3@example.com',
+            'password': 'Password123',
+            'passwordRepeat': 'Password124',
+        }
+        res = self.client.post(CREATE_USER_URL, payload)
+
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(res.data.keys(), {'username', 'passwordRepeat'})
+        self.assertEqual(res.data['username'][0], 'Username cannot be null')
+        self.assertEqual(res.data['passwordRepeat'][0], 'password_mismatch')
+
+    def test_create_user_numeric_password_matches_its_string_repeat(self):
+        """Test that a JSON number password is compared as the string its
+        field coerces it to, so it is not reported as a mismatch."""
+        payload = {
+            'username': 'testuser3',
+            'email': 'test3@example.com',
+            'password': 12345678,
+            'passwordRepeat': '12345678',
+        }
+        res = self.client.post(CREATE_USER_URL, payload, format='json')
+
+        self.assertNotIn('passwordRepeat', res.data)
+
     def test_create_user_with_null_password_repeat_error(self):
         """Test error returned if passwordRepeat is null."""
         payload = {
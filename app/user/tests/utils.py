@@ -0,0 +1,10 @@
+"""Shared helpers for the user app tests."""
+
+# Tests run with a dummy cache; tests that rely on caching opt back in
+# with override_settings(CACHES=LOCMEM_CACHES), clearing the cache before
+# and after, since locmem entries outlive the settings override
+LOCMEM_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    }
+}
@@ -1,4 +1,6 @@
 """Views for dashboard API endpoints."""
+import hashlib
+
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 from drf_spectacular.utils import (
@@ -29,12 +31,149 @@ from .serializers_dashboard import (
 )
 from core.models import LoginActivity
 from django.contrib.auth import get_user_model
-from django.db.models import Q
+from django.core.cache import cache
+from django.db.models import Count, Max, Q
 from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 from rest_framework.exceptions import PermissionDenied, ValidationError
 
 User = get_user_model()
 
+# Seconds the admin dashboard data version is cached for ETag checks
+ADMIN_DASHBOARD_ETAG_TIMEOUT = 5
+
+# Seconds a user's own chart data is cached for
+USER_CHART_CACHE_TIMEOUT = 120
+
+# Seconds the admin dashboard data is cached for
+ADMIN_DASHBOARD_CACHE_TIMEOUT = 60
+
+# Seconds the system-wide admin chart data is cached for
+ADMIN_CHART_CACHE_TIMEOUT = 120
+
+
+def _admin_dashboard_data_version():
+    """
+    Return a cheap version string for the admin dashboard data.
+
+    It changes when a login is recorded or a user is added, removed or
+    saved, e.g. on a role change that moves them between filters. The
+    latest login is read from the primary key index, so no query scans
+    the login activity table; activities are only deleted along with
+    their user, which changes the user count.
+    """
+    latest_login = LoginActivity.objects.aggregate(latest=Max('pk'))
+    users = User.objects.aggregate(
+        updated=Max('updated_at'), count=Count('id')
+    )
+    return (
+        f"{latest_login['latest']}:{users['updated']}:{users['count']}"
+    )
+
+
+def _cached_admin_dashboard_data_version():
+    """
+    Return the admin dashboard data version, cached for a few seconds.
+
+    Repeated polls with a matching If-None-Match header then get a 304
+    without running the dashboard queries or serializer.
+    """
+    return cache.get_or_set(
+        'admin_dashboard_etag_version',
+        _admin_dashboard_data_version,
+        ADMIN_DASHBOARD_ETAG_TIMEOUT
+    )
+
+
+def admin_dashboard_etag(request, version):
+    """
+    Return the ETag for an admin dashboard response at a data version.
+
+    Only call it once the query parameters are valid, so error responses
+    never carry an ETag.
+    """
+    key = f'{version}:{request.user.pk}:{request.get_full_path()}'
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def _cached_user_chart_data(chart, chart_func, user, start_date, end_date):
+    """
+    Return chart data for a single user, cached per user and date range.
+
+    Charts are polled with the same parameters repeatedly, so a cache hit
+    skips the aggregation queries entirely. Like the admin dashboard, the
+    key includes the data version, so a new login shows up once the
+    version moves on rather than after USER_CHART_CACHE_TIMEOUT seconds.
+    """
+    cache_key = 'chart:{}:{}:{}:{}:{}'.format(
+        _cached_admin_dashboard_data_version(),
+        user.pk,
+        chart,
+        start_date.isoformat() if start_date else '',
+        end_date.isoformat() if end_date else ''
+    )
+    return cache.get_or_set(
+        cache_key,
+        lambda: chart_func(user, start_date, end_date),
+        USER_CHART_CACHE_TIMEOUT
+    )
+
+
+def _cached_admin_chart_data(start_date, end_date):
+    """
+    Return system-wide admin chart data, cached per version and date range.
+
+    The charts are the same for every admin, so only the data version and
+    the date range go into the key, as with the per-user chart cache.
+    """
+    cache_key = 'admin_chart:{}:{}:{}'.format(
+        _cached_admin_dashboard_data_version(),
+        start_date.isoformat() if start_date else '',
+        end_date.isoformat() if end_date else ''
+    )
+    return cache.get_or_set(
+        cache_key,
+        lambda: get_admin_chart_data(start_date, end_date),
+        ADMIN_CHART_CACHE_TIMEOUT
+    )
+
+
+def _cached_admin_dashboard_data(version, start_date, end_date, me=None,
+                                 user_ids=None, role=None, filter_type=None):
+    """
+    Return serialized admin dashboard data, cached per version and filters.
+
+    The aggregates are the same for every admin polling the same filters,
+    so a cache hit skips the dashboard queries and the serializer entirely.
+    Only the serialized dict is cached, never model instances, so no user
+    rows end up pickled in the cache backend. Only the me filter
+    depends on the requesting admin, so only it adds the user to the key.
+    Keying on the version the ETag is built from keeps every body in step
+    with the ETag it is sent with.
+    """
+    cache_key = 'admin_dashboard:{}:{}:{}:{}:{}:{}:{}'.format(
+        version,
+        me.pk if me else '',
+        ','.join(str(uid) for uid in sorted(user_ids or ())),
+        role or '',
+        filter_type or '',
+        start_date.isoformat() if start_date else '',
+        end_date.isoformat() if end_date else ''
+    )
+    return cache.get_or_set(
+        cache_key,
+        lambda: dict(AdminDashboardSerializer(get_admin_dashboard_data(
+            role=role,
+            me=me,
+            user_ids=user_ids,
+            filter_type=filter_type,
+            start_date=start_date,
+            end_date=end_date
+        )).data),
+        ADMIN_DASHBOARD_CACHE_TIMEOUT
+    )
+
 
 class UserStatsView(DateFilterMixin, generics.GenericAPIView):
     """API endpoint to get user statistics."""
@@ -412,24 +551,33 @@ class AdminDashboardView(DateFilterMixin, generics.GenericAPIView):
                         status=status.HTTP_400_BAD_REQUEST
                     )
 
+        # The parameters are valid, so answer a matching If-None-Match
+        # before running the dashboard queries
+        version = _cached_admin_dashboard_data_version()
+        etag = quote_etag(admin_dashboard_etag(request, version))
+        response = get_conditional_response(request, etag=etag)
+        if response is not None:
+            response['ETag'] = etag
+            return response
+
         # Parameter precedence: me or filter=me > user_ids > role/filter_type
         if (me and me.lower() == 'true') or filter_type == 'me':
-            dashboard_data = get_admin_dashboard_data(
-                me=request.user, start_date=start_date, end_date=end_date)
+            dashboard_data = _cached_admin_dashboard_data(
+                version, start_date, end_date, me=request.user)
         elif user_ids:
             # user_ids provided and not empty
-            dashboard_data = get_admin_dashboard_data(
-                user_ids=user_ids, start_date=start_date, end_date=end_date)
+            dashboard_data = _cached_admin_dashboard_data(
+                version, start_date, end_date, user_ids=user_ids)
         else:
-            dashboard_data = get_admin_dashboard_data(
+            dashboard_data = _cached_admin_dashboard_data(
+                version,
+                start_date,
+                end_date,
                 role=role,
-                filter_type=filter_type,
-                start_date=start_date,
-                end_date=end_date
+                filter_type=filter_type
             )
 
-        serializer = self.get_serializer(dashboard_data)
-        return Response(serializer.data)
+        return Response(dashboard_data, headers={'ETag': etag})
 
 
 # Chart Data API Views
@@ -610,7 +758,8 @@ class LoginTrendsView(DateFilterMixin, generics.GenericAPIView):
                 users, start_date, end_date)
         else:
             # Default: current user's data
-            trends_data = get_login_trends_data(
+            trends_data = _cached_user_chart_data(
+                'login_trends', get_login_trends_data,
                 request.user, start_date, end_date)
 
         return Response({
@@ -776,7 +925,8 @@ class LoginComparisonView(DateFilterMixin, generics.GenericAPIView):
                 users, start_date, end_date)
         else:
             # Default: current user's data
-            comparison_data = get_login_comparison_data(
+            comparison_data = _cached_user_chart_data(
+                'login_comparison', get_login_comparison_data,
                 request.user, start_date, end_date)
 
         return Response({
@@ -965,7 +1115,8 @@ class LoginDistributionView(DateFilterMixin, generics.GenericAPIView):
                 users, start_date, end_date)
         else:
             # Default: current user's data
-            distribution_data = get_login_distribution_data(
+            distribution_data = _cached_user_chart_data(
+                'login_distribution', get_login_distribution_data,
                 request.user, start_date, end_date)
 
         return Response({
@@ -1061,7 +1212,7 @@ class AdminChartsView(DateFilterMixin, generics.GenericAPIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        admin_chart_data = get_admin_chart_data(start_date, end_date)
+        admin_chart_data = _cached_admin_chart_data(start_date, end_date)
 
         return Response({
             'admin_charts': admin_chart_data